@@ -0,0 +1,24 @@
+"""Shared structlog setup for the example scripts."""
+
+import sys
+
+import structlog
+
+
+def configure_logging() -> None:
+    """Configure structlog: pretty console on a TTY, JSON lines otherwise.
+
+    The JSON renderer skips ConsoleRenderer's per-call ANSI formatting in
+    piped/CI runs and keeps the output machine-parseable.
+    """
+    renderer = (
+        structlog.dev.ConsoleRenderer()
+        if sys.stdout.isatty()
+        else structlog.processors.JSONRenderer()
+    )
+    structlog.configure(
+        processors=[
+            structlog.stdlib.add_log_level,
+            renderer,
+        ],
+    )
@@ -7,15 +7,29 @@ Installation:
     Zip the examples/blender_addon folder and install via Edit > Preferences > Add-ons > Install
 """
 
+import concurrent.futures
 import os
 import time
 
 import bpy
-import mathutils
 import numpy as np
 
 from .nodes import setup_geometry_nodes, setup_material
-from .splat_io import SUPPORTED_EXTENSIONS, GaussianData, load_splat
+from .splat_io import (
+    SUPPORTED_EXTENSIONS_STR,
+    GaussianData,
+    filter_gaussians,
+    load_splat,
+)
+
+# Worker used to parse splat files off the main thread; Blender API calls
+# must still happen on the main thread, so results are marshalled back via
+# bpy.app.timers.
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+# SUPPORTED_EXTENSIONS_STR is immutable at runtime; build the panel label
+# once instead of joining on every redraw.
+_SUPPORTED_FORMATS_LABEL = "Formats: " + SUPPORTED_EXTENSIONS_STR
 
 bl_info = {
     "name": "USD Gaussian Splats Previewer",
@@ -62,12 +76,48 @@ class SplatPreviewPreferences(bpy.types.AddonPreferences):
         default=False,
     )
 
+    verbose_import: bpy.props.BoolProperty(
+        name="Verbose Import",
+        description="Print splat counts and timings to the console on import",
+        default=False,
+    )
+
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "max_splat_count")
         layout.prop(self, "opacity_threshold")
         layout.prop(self, "scale_multiplier")
         layout.prop(self, "point_cloud_mode")
+        layout.prop(self, "verbose_import")
+
+
+# Cache of input-socket property paths per node group, keyed by group name.
+# interface.items_tree is an RNA collection walk; doing it on every panel
+# redraw (tens of Hz during mouse drags) is wasted work for a static graph.
+# The '["identifier"]' paths are prebuilt so draw does no string formatting.
+_SOCKET_ID_CACHE: dict[str, dict[str, str]] = {}
+
+def _input_socket_paths(node_group: bpy.types.NodeTree) -> dict[str, str]:
+    """Return a cached name -> modifier property path map of input sockets."""
+    cached = _SOCKET_ID_CACHE.get(node_group.name)
+    if cached is None:
+        cached = {
+            item.name: f'["{item.identifier}"]'
+            for item in node_group.interface.items_tree
+            if item.item_type == "SOCKET" and item.in_out == "INPUT"
+        }
+        _SOCKET_ID_CACHE[node_group.name] = cached
+    return cached
+
+
+def _flat_f32(arr: np.ndarray) -> np.ndarray:
+    """Return a flat, C-contiguous float32 view (or copy) of an array.
+
+    foreach_set only takes Blender's memcpy fast path when the source
+    buffer is contiguous and matches the attribute dtype; anything else
+    falls back to per-element conversion.
+    """
+    return np.ascontiguousarray(arr, dtype=np.float32).ravel()
 
 
 def get_preferences() -> SplatPreviewPreferences:
@@ -75,6 +125,96 @@ def get_preferences() -> SplatPreviewPreferences:
     return bpy.context.preferences.addons[__name__].preferences
 
 
+def _add_mesh_attributes(mesh: bpy.types.Mesh, data: GaussianData) -> None:
+    """Create and bulk-upload all Gaussian attributes on the mesh.
+
+    The flat float32 buffers are prepared in one block and the uploads run
+    back-to-back, so the foreach_set memcpys execute consecutively while
+    the per-splat arrays are still hot in cache.
+    """
+    pos_f = _flat_f32(data.positions)
+    op_f = _flat_f32(data.opacities)
+    sc_f = _flat_f32(data.scales)
+    # Colors are stored uint8 (0-255); upcast and rescale in place
+    col_f = data.colors.astype(np.float32).ravel()
+    col_f *= 1.0 / 255.0
+    max_sc_f = _flat_f32(data.max_scale)
+    # Rotation stays a quaternion (w, x, y, z); geometry nodes consume the
+    # rotation directly, so no per-splat Euler conversion on import
+    rot_f = _flat_f32(data.rotations)
+
+    # Create every attribute before uploading anything: attributes.new()
+    # may reallocate the mesh's attribute storage, invalidating Attribute
+    # references handed out earlier, so each one is re-fetched by name
+    # only once the layout is final
+    mesh.attributes.new(name="opacity", type="FLOAT", domain="POINT")
+    mesh.attributes.new(name="scale", type="FLOAT_VECTOR", domain="POINT")
+    mesh.attributes.new(name="color", type="FLOAT_VECTOR", domain="POINT")
+    mesh.attributes.new(name="rotation_quat", type="QUATERNION", domain="POINT")
+    mesh.attributes.new(name="max_scale", type="FLOAT", domain="POINT")
+
+    mesh.attributes["position"].data.foreach_set("vector", pos_f)
+    mesh.attributes["opacity"].data.foreach_set("value", op_f)
+    mesh.attributes["scale"].data.foreach_set("vector", sc_f)
+    mesh.attributes["color"].data.foreach_set("vector", col_f)
+    mesh.attributes["rotation_quat"].data.foreach_set("value", rot_f)
+    mesh.attributes["max_scale"].data.foreach_set("value", max_sc_f)
+
+
+def _create_splat_object(
+    filepath: str, gaussians: GaussianData, start_time: float
+) -> None:
+    """Build the Blender object for a loaded splat (main thread only)."""
+    prefs = get_preferences()
+    # Prefilter in numpy so the geometry-nodes evaluator never sees more
+    # than the preferred splat count
+    gaussians = filter_gaussians(
+        gaussians, prefs.max_splat_count, prefs.opacity_threshold
+    )
+    n_gaussians = len(gaussians.positions)
+    if prefs.verbose_import:
+        print(f"Loaded {n_gaussians:,} Gaussians in {time.time() - start_time:.2f}s")
+
+    # Set up EEVEE renderer (more stable for large gaussian counts)
+    bpy.context.scene.render.engine = "BLENDER_EEVEE_NEXT"
+    # Enable transparency
+    bpy.context.scene.eevee.use_raytracing = False
+
+    # Get name from filename
+    splat_name = os.path.splitext(os.path.basename(filepath))[0]
+
+    # Create mesh and bulk-upload all attributes (positions included), then
+    # finalize the mesh once
+    mesh = bpy.data.meshes.new(name=f"{splat_name}_mesh")
+    mesh.vertices.add(n_gaussians)
+    _add_mesh_attributes(mesh, gaussians)
+    mesh.update(calc_edges=False, calc_edges_loose=False)
+
+    # Create object
+    obj = bpy.data.objects.new(splat_name, mesh)
+    bpy.context.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+
+    # Apply rotation to match Blender coordinate systems
+    obj.rotation_mode = "XYZ"
+    obj.rotation_euler = (np.pi / 2, 0, 0)
+    obj["gaussian_splatting"] = True
+
+    # Set up material and geometry nodes with preferences
+    setup_material(obj)
+    setup_geometry_nodes(
+        obj,
+        max_splat_count=prefs.max_splat_count,
+        opacity_threshold=prefs.opacity_threshold,
+        scale_multiplier=prefs.scale_multiplier,
+        point_cloud_mode=prefs.point_cloud_mode,
+    )
+
+    if prefs.verbose_import:
+        print(f"Total import time: {time.time() - start_time:.2f}s")
+
+
 class ImportGaussianSplatting(bpy.types.Operator):
     """Import a Gaussian splat file."""
 
@@ -101,89 +241,37 @@ class ImportGaussianSplatting(bpy.types.Operator):
 
         start_time = time.time()
 
-        try:
-            gaussians = load_splat(self.filepath)
-        except Exception as e:
-            self.report({"ERROR"}, f"Failed to load: {e}")
-            return {"CANCELLED"}
-
-        n_gaussians = len(gaussians.positions)
-        print(f"Loaded {n_gaussians:,} Gaussians in {time.time() - start_time:.2f}s")
-
-        # Set up EEVEE renderer (more stable for large gaussian counts)
-        bpy.context.scene.render.engine = "BLENDER_EEVEE_NEXT"
-        # Enable transparency
-        bpy.context.scene.eevee.use_raytracing = False
-
-        # Get name from filename
-        splat_name = os.path.splitext(os.path.basename(self.filepath))[0]
-
-        # Create mesh from positions
-        mesh = bpy.data.meshes.new(name=f"{splat_name}_mesh")
-        mesh.from_pydata(gaussians.positions.tolist(), [], [])
-        mesh.update()
-
-        # Add attributes
-        self._add_mesh_attributes(mesh, gaussians)
-
-        # Create object
-        obj = bpy.data.objects.new(splat_name, mesh)
-        bpy.context.collection.objects.link(obj)
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-
-        # Apply rotation to match Blender coordinate systems
-        obj.rotation_mode = "XYZ"
-        obj.rotation_euler = (np.pi / 2, 0, 0)
-        obj["gaussian_splatting"] = True
-
-        # Set up material and geometry nodes with preferences
-        prefs = get_preferences()
-        setup_material(obj)
-        setup_geometry_nodes(
-            obj,
-            max_splat_count=prefs.max_splat_count,
-            opacity_threshold=prefs.opacity_threshold,
-            scale_multiplier=prefs.scale_multiplier,
-            point_cloud_mode=prefs.point_cloud_mode,
-        )
+        # Parse the file off the main thread so the UI stays responsive;
+        # mesh creation is marshalled back via a timer since Blender's API
+        # must only be touched from the main thread.
+        future = _EXECUTOR.submit(load_splat, self.filepath)
+        filepath = self.filepath
+
+        def poll() -> float | None:
+            if not future.done():
+                return 0.05
+            try:
+                gaussians = future.result()
+            except Exception as e:
+                # The operator has already returned, so self.report is
+                # gone; raise a popup from the timer (stdout alone is
+                # invisible without a console)
+                message = f"Failed to load splat {filepath}: {e}"
+                print(message)
+
+                def draw_error(menu, _context) -> None:
+                    menu.layout.label(text=message)
+
+                bpy.context.window_manager.popup_menu(
+                    draw_error, title="Splat import failed", icon="ERROR"
+                )
+                return None
+            _create_splat_object(filepath, gaussians, start_time)
+            return None
 
-        print(f"Total import time: {time.time() - start_time:.2f}s")
+        bpy.app.timers.register(poll)
         return {"FINISHED"}
 
-    def _add_mesh_attributes(self, mesh: bpy.types.Mesh, data: GaussianData) -> None:
-        """Add Gaussian attributes to mesh."""
-        n = len(data.positions)
-
-        # Opacity
-        opacity_attr = mesh.attributes.new(name="opacity", type="FLOAT", domain="POINT")
-        opacity_attr.data.foreach_set("value", data.opacities.flatten())
-
-        # Scale
-        scale_attr = mesh.attributes.new(
-            name="scale", type="FLOAT_VECTOR", domain="POINT"
-        )
-        scale_attr.data.foreach_set("vector", data.scales.flatten())
-
-        # Color (RGB)
-        color_attr = mesh.attributes.new(
-            name="color", type="FLOAT_VECTOR", domain="POINT"
-        )
-        color_attr.data.foreach_set("vector", data.colors.flatten())
-
-        # Rotation as euler (for geometry nodes instancing)
-        euler_rotations = np.zeros((n, 3), dtype=np.float32)
-        for i in range(n):
-            w, x, y, z = data.rotations[i]
-            quat = mathutils.Quaternion((w, x, y, z))
-            euler = quat.to_euler()
-            euler_rotations[i] = (euler.x, euler.y, euler.z)
-
-        rot_attr = mesh.attributes.new(
-            name="rotation_euler", type="FLOAT_VECTOR", domain="POINT"
-        )
-        rot_attr.data.foreach_set("vector", euler_rotations.flatten())
-
     def invoke(self, context, event):
         context.window_manager.fileselect_add(self)
         return {"RUNNING_MODAL"}
@@ -202,13 +290,12 @@ class GaussianSplattingPanel(bpy.types.Panel):
         layout = self.layout
 
         # Import button
-        supported = ", ".join(sorted(SUPPORTED_EXTENSIONS))
         layout.operator(
             ImportGaussianSplatting.bl_idname,
             text="Import Splat",
             icon="IMPORT",
         )
-        layout.label(text=f"Formats: {supported}")
+        layout.label(text=_SUPPORTED_FORMATS_LABEL)
 
         # Show controls if a gaussian splat object is selected
         obj = context.active_object
@@ -220,38 +307,37 @@ class GaussianSplattingPanel(bpy.types.Panel):
                     text=f"Selected: {obj.name}", icon="OUTLINER_OB_POINTCLOUD"
                 )
 
+                socket_paths = _input_socket_paths(mod.node_group)
+
                 # Splat Filtering section
                 box = layout.box()
                 box.label(text="Splat Filtering:")
 
-                # Find the modifier input identifiers for our custom sockets
-                for item in mod.node_group.interface.items_tree:
-                    if item.item_type == "SOCKET" and item.in_out == "INPUT":
-                        if item.name == "Max Splat Count":
-                            box.prop(mod, f'["{item.identifier}"]', text="Max Splats")
-                        elif item.name == "Opacity Threshold":
-                            box.prop(
-                                mod, f'["{item.identifier}"]', text="Opacity Threshold"
-                            )
+                if "Max Splat Count" in socket_paths:
+                    box.prop(mod, socket_paths["Max Splat Count"], text="Max Splats")
+                if "Opacity Threshold" in socket_paths:
+                    box.prop(
+                        mod,
+                        socket_paths["Opacity Threshold"],
+                        text="Opacity Threshold",
+                    )
 
                 # Display Options section
                 box = layout.box()
                 box.label(text="Display Options:")
 
-                # Scale Multiplier
-                for item in mod.node_group.interface.items_tree:
-                    if item.item_type == "SOCKET" and item.in_out == "INPUT":
-                        if item.name == "Scale Multiplier":
-                            box.prop(
-                                mod, f'["{item.identifier}"]', text="Scale Multiplier"
-                            )
-
-                # Point cloud toggle (from geometry nodes)
-                bool_node = mod.node_group.nodes.get("Boolean")
-                if bool_node:
+                if "Scale Multiplier" in socket_paths:
                     box.prop(
-                        bool_node,
-                        "boolean",
+                        mod,
+                        socket_paths["Scale Multiplier"],
+                        text="Scale Multiplier",
+                    )
+
+                # Point cloud toggle (per-object modifier input)
+                if "Point Cloud Mode" in socket_paths:
+                    box.prop(
+                        mod,
+                        socket_paths["Point Cloud Mode"],
                         text="Point Cloud (faster)",
                     )
 
@@ -276,22 +362,14 @@ class GaussianSplattingPrefsPanel(bpy.types.Panel):
         layout.prop(prefs, "point_cloud_mode", text="Point Cloud Mode")
 
 
-classes = [
+classes = (
     SplatPreviewPreferences,
     ImportGaussianSplatting,
     GaussianSplattingPanel,
     GaussianSplattingPrefsPanel,
-]
-
-
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
+)
 
-def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+register, unregister = bpy.utils.register_classes_factory(classes)
 
 
 if __name__ == "__main__":
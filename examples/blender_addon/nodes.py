@@ -16,11 +16,19 @@ def setup_material(obj: bpy.types.Object) -> None:
     Material graph:
         Geometry.Normal ───┐
                            ├─► Dot Product ──┐
-        Geometry.Incoming ─┘                 ├─► Multiply ──► BSDF.Alpha
-        opacity.Fac ─────────────────────────┘
+        Geometry.Incoming ─┘                 ├─► Multiply ──┐
+        opacity.Fac ─────────────────────────┘              ├─► BSDF.Alpha
+        splat_uv ──► r² ──► exp(-8·r²) ─────────────────────┘
 
         color.Color ──► Gamma(2.2) ──► BSDF.Emission
     """
+    # The graph is identical for every splat; reuse one shared datablock
+    # instead of rebuilding ~15 shader nodes per import
+    mat = bpy.data.materials.get("GaussianSplatMaterial")
+    if mat is not None:
+        obj.data.materials.append(mat)
+        return
+
     mat = bpy.data.materials.new(name="GaussianSplatMaterial")
     mat.use_nodes = True
     mat.blend_method = "HASHED"
@@ -53,6 +61,40 @@ def setup_material(obj: bpy.types.Object) -> None:
     tree.links.new(dot_product.outputs["Value"], multiply.inputs[0])
     tree.links.new(opacity_attr.outputs["Fac"], multiply.inputs[1])
 
+    # === Radial Gaussian falloff across the splat quad ===
+    # The ellipsoid branch instances flat quads carrying centred local
+    # coords in "splat_uv" (see _build_splat_geometry_tree); exp(-8 r²)
+    # makes the quad read as a soft Gaussian footprint. Point-cloud
+    # geometry has no such attribute, so r² = 0 and the falloff is 1.
+    uv_attr = tree.nodes.new("ShaderNodeAttribute")
+    uv_attr.location = (-600, 400)
+    uv_attr.attribute_name = "splat_uv"
+    uv_attr.attribute_type = "GEOMETRY"
+
+    r_squared = tree.nodes.new("ShaderNodeVectorMath")
+    r_squared.location = (-400, 400)
+    r_squared.operation = "DOT_PRODUCT"
+    tree.links.new(uv_attr.outputs["Vector"], r_squared.inputs[0])
+    tree.links.new(uv_attr.outputs["Vector"], r_squared.inputs[1])
+
+    neg_r_squared = tree.nodes.new("ShaderNodeMath")
+    neg_r_squared.location = (-250, 400)
+    neg_r_squared.operation = "MULTIPLY"
+    neg_r_squared.inputs[1].default_value = -8.0
+    tree.links.new(r_squared.outputs["Value"], neg_r_squared.inputs[0])
+
+    falloff = tree.nodes.new("ShaderNodeMath")
+    falloff.location = (-100, 400)
+    falloff.operation = "EXPONENT"
+    tree.links.new(neg_r_squared.outputs["Value"], falloff.inputs[0])
+
+    alpha = tree.nodes.new("ShaderNodeMath")
+    alpha.location = (50, 200)
+    alpha.operation = "MULTIPLY"
+    alpha.use_clamp = True
+    tree.links.new(multiply.outputs["Value"], alpha.inputs[0])
+    tree.links.new(falloff.outputs["Value"], alpha.inputs[1])
+
     # === Color attribute ===
     color_attr = tree.nodes.new("ShaderNodeAttribute")
     color_attr.location = (-600, -250)
@@ -75,8 +117,8 @@ def setup_material(obj: bpy.types.Object) -> None:
     # Emission from gamma-corrected color
     tree.links.new(gamma.outputs["Color"], bsdf.inputs["Emission Color"])
     bsdf.inputs["Emission Strength"].default_value = 1.0
-    # Alpha from dot product × opacity
-    tree.links.new(multiply.outputs["Value"], bsdf.inputs["Alpha"])
+    # Alpha from dot product × opacity × radial falloff
+    tree.links.new(alpha.outputs["Value"], bsdf.inputs["Alpha"])
 
     # === Output ===
     output = tree.nodes.new("ShaderNodeOutputMaterial")
@@ -89,10 +131,10 @@ def setup_material(obj: bpy.types.Object) -> None:
 def _create_splat_limit_node_group() -> bpy.types.NodeTree:
     """Create a custom node group for limiting splat count.
 
-    Filtering logic:
-    1. Delete splats with opacity < threshold
-    2. Sort remaining by max scale dimension (descending)
-    3. Keep only the top N splats
+    Filtering logic: delete splats past the top N or with opacity <
+    threshold in a single pass. The importer uploads points pre-sorted
+    descending by max scale, so "top N by scale" is just "first N" and no
+    per-frame sort node is needed.
 
     Inputs:
         - Geometry: Input geometry with opacity/scale attributes
@@ -136,7 +178,7 @@ def _create_splat_limit_node_group() -> bpy.types.NodeTree:
     output_node = tree.nodes.new("NodeGroupOutput")
     output_node.location = (800, 0)
 
-    # --- Step 1: Delete by opacity threshold ---
+    # --- Step 1: Opacity cut (combined into the single delete below) ---
     opacity_attr = tree.nodes.new("GeometryNodeInputNamedAttribute")
     opacity_attr.location = (-1000, -150)
     opacity_attr.data_type = "FLOAT"
@@ -145,62 +187,13 @@ def _create_splat_limit_node_group() -> bpy.types.NodeTree:
     opacity_compare = tree.nodes.new("FunctionNodeCompare")
     opacity_compare.location = (-800, -100)
     opacity_compare.data_type = "FLOAT"
-    opacity_compare.operation = "GREATER_EQUAL"
+    opacity_compare.operation = "LESS_THAN"
     tree.links.new(opacity_attr.outputs["Attribute"], opacity_compare.inputs["A"])
     tree.links.new(input_node.outputs["Opacity Threshold"], opacity_compare.inputs["B"])
 
-    delete_by_opacity = tree.nodes.new("GeometryNodeDeleteGeometry")
-    delete_by_opacity.location = (-600, 0)
-    delete_by_opacity.domain = "POINT"
-    delete_by_opacity.mode = "ALL"
-    tree.links.new(input_node.outputs["Geometry"], delete_by_opacity.inputs["Geometry"])
-    # Delete where NOT (opacity >= threshold), i.e., delete where opacity < threshold
-    invert_opacity = tree.nodes.new("FunctionNodeBooleanMath")
-    invert_opacity.location = (-700, -100)
-    invert_opacity.operation = "NOT"
-    tree.links.new(opacity_compare.outputs["Result"], invert_opacity.inputs[0])
-    tree.links.new(
-        invert_opacity.outputs["Boolean"], delete_by_opacity.inputs["Selection"]
-    )
-
-    # --- Step 2: Compute max scale per point ---
-    scale_attr = tree.nodes.new("GeometryNodeInputNamedAttribute")
-    scale_attr.location = (-400, -200)
-    scale_attr.data_type = "FLOAT_VECTOR"
-    scale_attr.inputs["Name"].default_value = "scale"
-
-    separate_xyz = tree.nodes.new("ShaderNodeSeparateXYZ")
-    separate_xyz.location = (-200, -200)
-    tree.links.new(scale_attr.outputs["Attribute"], separate_xyz.inputs["Vector"])
-
-    max_xy = tree.nodes.new("ShaderNodeMath")
-    max_xy.location = (0, -150)
-    max_xy.operation = "MAXIMUM"
-    tree.links.new(separate_xyz.outputs["X"], max_xy.inputs[0])
-    tree.links.new(separate_xyz.outputs["Y"], max_xy.inputs[1])
-
-    max_xyz = tree.nodes.new("ShaderNodeMath")
-    max_xyz.location = (150, -150)
-    max_xyz.operation = "MAXIMUM"
-    tree.links.new(max_xy.outputs["Value"], max_xyz.inputs[0])
-    tree.links.new(separate_xyz.outputs["Z"], max_xyz.inputs[1])
-
-    # --- Step 3: Sort by max scale (descending = negate then sort ascending) ---
-    negate_scale = tree.nodes.new("ShaderNodeMath")
-    negate_scale.location = (300, -150)
-    negate_scale.operation = "MULTIPLY"
-    negate_scale.inputs[1].default_value = -1.0
-    tree.links.new(max_xyz.outputs["Value"], negate_scale.inputs[0])
-
-    sort_elements = tree.nodes.new("GeometryNodeSortElements")
-    sort_elements.location = (-200, 0)
-    sort_elements.domain = "POINT"
-    tree.links.new(
-        delete_by_opacity.outputs["Geometry"], sort_elements.inputs["Geometry"]
-    )
-    tree.links.new(negate_scale.outputs["Value"], sort_elements.inputs["Sort Weight"])
-
-    # --- Step 4: Delete where index >= max_count ---
+    # --- Step 2: One delete for both cuts ---
+    # Delete Geometry in ALL mode rebuilds every attribute array; OR-ing
+    # the two selections keeps that rebuild to a single pass
     index_node = tree.nodes.new("GeometryNodeInputIndex")
     index_node.location = (200, 100)
 
@@ -211,52 +204,41 @@ def _create_splat_limit_node_group() -> bpy.types.NodeTree:
     tree.links.new(index_node.outputs["Index"], index_compare.inputs["A"])
     tree.links.new(input_node.outputs["Max Count"], index_compare.inputs["B"])
 
-    delete_by_count = tree.nodes.new("GeometryNodeDeleteGeometry")
-    delete_by_count.location = (600, 0)
-    delete_by_count.domain = "POINT"
-    delete_by_count.mode = "ALL"
-    tree.links.new(
-        sort_elements.outputs["Geometry"], delete_by_count.inputs["Geometry"]
-    )
-    tree.links.new(index_compare.outputs["Result"], delete_by_count.inputs["Selection"])
+    combine_cuts = tree.nodes.new("FunctionNodeBooleanMath")
+    combine_cuts.location = (400, -50)
+    combine_cuts.operation = "OR"
+    tree.links.new(index_compare.outputs["Result"], combine_cuts.inputs[0])
+    tree.links.new(opacity_compare.outputs["Result"], combine_cuts.inputs[1])
 
-    tree.links.new(delete_by_count.outputs["Geometry"], output_node.inputs["Geometry"])
+    delete_points = tree.nodes.new("GeometryNodeDeleteGeometry")
+    delete_points.location = (600, 0)
+    delete_points.domain = "POINT"
+    delete_points.mode = "ALL"
+    tree.links.new(input_node.outputs["Geometry"], delete_points.inputs["Geometry"])
+    tree.links.new(combine_cuts.outputs["Boolean"], delete_points.inputs["Selection"])
+
+    tree.links.new(delete_points.outputs["Geometry"], output_node.inputs["Geometry"])
 
     return tree
 
 
-def setup_geometry_nodes(
-    obj: bpy.types.Object,
-    max_splat_count: int = 500000,
-    opacity_threshold: float = 0.1,
-    scale_multiplier: float = 1.0,
-    point_cloud_mode: bool = True,
-) -> None:
-    """Create geometry nodes with point cloud / ellipsoid toggle.
+def _build_splat_geometry_tree() -> bpy.types.NodeTree:
+    """Build the shared splat geometry node tree (point cloud / ellipsoid).
 
-    Args:
-        obj: The Blender object to add geometry nodes to.
-        max_splat_count: Maximum number of splats to display.
-        opacity_threshold: Minimum opacity to display.
-        scale_multiplier: Scale multiplier for splat size.
-        point_cloud_mode: If True, use point cloud mode (faster).
+    Built once and reused by every imported splat; per-object parameters
+    (max count, opacity threshold, scale multiplier, point cloud mode)
+    live on each object's modifier, not in the tree.
 
     Node layout:
         Left column: Input, Splat Filter, Multiply
         Top row: Ellipsoid branch (Mesh to Points, Ico, Shade Smooth, Instance, Realize)
         Bottom row: Point cloud branch (scale processing, Mesh to Points)
-        Right column: Boolean, Switch, Set Material, Output
+        Right column: Switch, Set Material, Output
     """
-    # Get the material we created
-    mat = obj.data.materials[0] if obj.data.materials else None
-
     geo_tree = bpy.data.node_groups.new(
         name="GaussianSplatGeometry", type="GeometryNodeTree"
     )
 
-    mod = obj.modifiers.new(name="Geometry Nodes", type="NODES")
-    mod.node_group = geo_tree
-
     # === Interface sockets ===
     geo_tree.interface.new_socket(
         name="Geometry", in_out="INPUT", socket_type="NodeSocketGeometry"
@@ -265,37 +247,32 @@ def setup_geometry_nodes(
     max_count_socket = geo_tree.interface.new_socket(
         name="Max Splat Count", in_out="INPUT", socket_type="NodeSocketInt"
     )
-    max_count_socket.default_value = max_splat_count
+    max_count_socket.default_value = 500000
     max_count_socket.min_value = 1
 
     opacity_thresh_socket = geo_tree.interface.new_socket(
         name="Opacity Threshold", in_out="INPUT", socket_type="NodeSocketFloat"
     )
-    opacity_thresh_socket.default_value = opacity_threshold
+    opacity_thresh_socket.default_value = 0.1
     opacity_thresh_socket.min_value = 0.0
     opacity_thresh_socket.max_value = 1.0
 
     scale_mult_socket = geo_tree.interface.new_socket(
         name="Scale Multiplier", in_out="INPUT", socket_type="NodeSocketFloat"
     )
-    scale_mult_socket.default_value = scale_multiplier
+    scale_mult_socket.default_value = 1.0
     scale_mult_socket.min_value = 1.0
     scale_mult_socket.max_value = 10.0
 
+    pc_mode_socket = geo_tree.interface.new_socket(
+        name="Point Cloud Mode", in_out="INPUT", socket_type="NodeSocketBool"
+    )
+    pc_mode_socket.default_value = True
+
     geo_tree.interface.new_socket(
         name="Geometry", in_out="OUTPUT", socket_type="NodeSocketGeometry"
     )
 
-    # Set defaults on the modifier explicitly (interface defaults don't always apply)
-    for item in geo_tree.interface.items_tree:
-        if item.item_type == "SOCKET" and item.in_out == "INPUT":
-            if item.name == "Max Splat Count":
-                mod[item.identifier] = max_splat_count
-            elif item.name == "Opacity Threshold":
-                mod[item.identifier] = opacity_threshold
-            elif item.name == "Scale Multiplier":
-                mod[item.identifier] = scale_multiplier
-
     # === LEFT COLUMN ===
     input_node = geo_tree.nodes.new("NodeGroupInput")
     input_node.location = (-800, 0)
@@ -330,6 +307,8 @@ def setup_geometry_nodes(
 
     set_material = geo_tree.nodes.new("GeometryNodeSetMaterial")
     set_material.location = (1200, 100)
+    # The splat material is a shared singleton (see setup_material)
+    mat = bpy.data.materials.get("GaussianSplatMaterial")
     if mat:
         set_material.inputs["Material"].default_value = mat
 
@@ -338,13 +317,8 @@ def setup_geometry_nodes(
     point_cloud_switch.input_type = "GEOMETRY"
     point_cloud_switch.label = "Point Cloud Mode"
 
-    bool_node = geo_tree.nodes.new("FunctionNodeInputBool")
-    bool_node.location = (1000, 250)
-    bool_node.boolean = point_cloud_mode
-    bool_node.label = "Point Cloud (faster)"
-
     geo_tree.links.new(
-        bool_node.outputs["Boolean"], point_cloud_switch.inputs["Switch"]
+        input_node.outputs["Point Cloud Mode"], point_cloud_switch.inputs["Switch"]
     )
     geo_tree.links.new(
         point_cloud_switch.outputs["Output"], set_material.inputs["Geometry"]
@@ -359,24 +333,42 @@ def setup_geometry_nodes(
         splat_limit_node.outputs["Geometry"], mesh_to_points_inst.inputs["Mesh"]
     )
 
-    # Ico Sphere
-    ico_sphere = geo_tree.nodes.new("GeometryNodeMeshIcoSphere")
-    ico_sphere.location = (-400, 50)
-    ico_sphere.inputs["Radius"].default_value = 1.0
-    ico_sphere.inputs["Subdivisions"].default_value = 2
-
-    # Set Shade Smooth
-    set_shade_smooth = geo_tree.nodes.new("GeometryNodeSetShadeSmooth")
-    set_shade_smooth.location = (-200, 50)
-    geo_tree.links.new(ico_sphere.outputs["Mesh"], set_shade_smooth.inputs["Geometry"])
-
-    # Named Attribute: rotation_euler
+    # A single quad per splat instead of an 80-tri ico sphere; the material
+    # fades it radially with an analytic Gaussian (see setup_material), so
+    # each splat rasterizes 2 triangles instead of 80
+    quad = geo_tree.nodes.new("GeometryNodeMeshGrid")
+    quad.location = (-400, 50)
+    quad.inputs["Size X"].default_value = 2.0
+    quad.inputs["Size Y"].default_value = 2.0
+    quad.inputs["Vertices X"].default_value = 2
+    quad.inputs["Vertices Y"].default_value = 2
+
+    # Bake centred local coords (-0.5..0.5) so the material can evaluate
+    # the falloff after instances are realized; centring makes the
+    # attribute's missing-value default (0) mean "no falloff", which keeps
+    # the shared material correct in point cloud mode
+    center_uv = geo_tree.nodes.new("ShaderNodeVectorMath")
+    center_uv.location = (-400, -100)
+    center_uv.operation = "SUBTRACT"
+    center_uv.inputs[1].default_value = (0.5, 0.5, 0.0)
+    geo_tree.links.new(quad.outputs["UV Map"], center_uv.inputs[0])
+
+    store_uv = geo_tree.nodes.new("GeometryNodeStoreNamedAttribute")
+    store_uv.location = (-200, 50)
+    store_uv.data_type = "FLOAT2"
+    store_uv.domain = "CORNER"
+    store_uv.inputs["Name"].default_value = "splat_uv"
+    geo_tree.links.new(quad.outputs["Mesh"], store_uv.inputs["Geometry"])
+    geo_tree.links.new(center_uv.outputs["Vector"], store_uv.inputs["Value"])
+
+    # Named Attribute: rotation_quat (quaternion, read as a rotation field)
     rot_attr = geo_tree.nodes.new("GeometryNodeInputNamedAttribute")
     rot_attr.location = (200, 200)
-    rot_attr.data_type = "FLOAT_VECTOR"
-    rot_attr.inputs["Name"].default_value = "rotation_euler"
+    rot_attr.data_type = "QUATERNION"
+    rot_attr.inputs["Name"].default_value = "rotation_quat"
 
-    # Named Attribute: scale (for ellipsoid)
+    # Named Attribute: scale (full vector; the ellipsoid instances need
+    # per-axis scaling, unlike the scalar point-cloud radius)
     scale_attr = geo_tree.nodes.new("GeometryNodeInputNamedAttribute")
     scale_attr.location = (200, 50)
     scale_attr.data_type = "FLOAT_VECTOR"
@@ -396,7 +388,7 @@ def setup_geometry_nodes(
         mesh_to_points_inst.outputs["Points"], instance_node.inputs["Points"]
     )
     geo_tree.links.new(
-        set_shade_smooth.outputs["Geometry"], instance_node.inputs["Instance"]
+        store_uv.outputs["Geometry"], instance_node.inputs["Instance"]
     )
     geo_tree.links.new(rot_attr.outputs["Attribute"], instance_node.inputs["Rotation"])
     geo_tree.links.new(scale_mult_inst.outputs["Vector"], instance_node.inputs["Scale"])
@@ -414,38 +406,17 @@ def setup_geometry_nodes(
     )
 
     # === BOTTOM ROW: POINT CLOUD BRANCH ===
-    # Named Attribute: scale (for point cloud)
-    scale_attr_pc = geo_tree.nodes.new("GeometryNodeInputNamedAttribute")
-    scale_attr_pc.location = (-200, -300)
-    scale_attr_pc.data_type = "FLOAT_VECTOR"
-    scale_attr_pc.inputs["Name"].default_value = "scale"
-
-    # Separate XYZ
-    separate_xyz = geo_tree.nodes.new("ShaderNodeSeparateXYZ")
-    separate_xyz.location = (0, -300)
-    geo_tree.links.new(
-        scale_attr_pc.outputs["Attribute"], separate_xyz.inputs["Vector"]
-    )
-
-    # Maximum (X, Y)
-    max_xy = geo_tree.nodes.new("ShaderNodeMath")
-    max_xy.location = (200, -250)
-    max_xy.operation = "MAXIMUM"
-    geo_tree.links.new(separate_xyz.outputs["X"], max_xy.inputs[0])
-    geo_tree.links.new(separate_xyz.outputs["Y"], max_xy.inputs[1])
-
-    # Maximum (XY, Z)
-    max_xyz = geo_tree.nodes.new("ShaderNodeMath")
-    max_xyz.location = (400, -250)
-    max_xyz.operation = "MAXIMUM"
-    geo_tree.links.new(max_xy.outputs["Value"], max_xyz.inputs[0])
-    geo_tree.links.new(separate_xyz.outputs["Z"], max_xyz.inputs[1])
+    # Named Attribute: baked per-point max scale
+    max_scale_attr = geo_tree.nodes.new("GeometryNodeInputNamedAttribute")
+    max_scale_attr.location = (0, -300)
+    max_scale_attr.data_type = "FLOAT"
+    max_scale_attr.inputs["Name"].default_value = "max_scale"
 
     # Multiply by scale multiplier
     scale_mult_pc = geo_tree.nodes.new("ShaderNodeMath")
     scale_mult_pc.location = (600, -250)
     scale_mult_pc.operation = "MULTIPLY"
-    geo_tree.links.new(max_xyz.outputs["Value"], scale_mult_pc.inputs[0])
+    geo_tree.links.new(max_scale_attr.outputs["Attribute"], scale_mult_pc.inputs[0])
     geo_tree.links.new(scale_mult_x2.outputs["Value"], scale_mult_pc.inputs[1])
 
     # Mesh to Points (for point cloud)
@@ -460,3 +431,43 @@ def setup_geometry_nodes(
     geo_tree.links.new(
         mesh_to_points.outputs["Points"], point_cloud_switch.inputs["True"]
     )
+
+    return geo_tree
+
+
+def setup_geometry_nodes(
+    obj: bpy.types.Object,
+    max_splat_count: int = 500000,
+    opacity_threshold: float = 0.1,
+    scale_multiplier: float = 1.0,
+    point_cloud_mode: bool = True,
+) -> None:
+    """Attach the shared splat geometry node group to an object.
+
+    The node tree is built once and reused across imports; only the
+    modifier's input values are per-object.
+
+    Args:
+        obj: The Blender object to add geometry nodes to.
+        max_splat_count: Maximum number of splats to display.
+        opacity_threshold: Minimum opacity to display.
+        scale_multiplier: Scale multiplier for splat size.
+        point_cloud_mode: If True, use point cloud mode (faster).
+    """
+    geo_tree = bpy.data.node_groups.get("GaussianSplatGeometry")
+    if geo_tree is None:
+        geo_tree = _build_splat_geometry_tree()
+
+    mod = obj.modifiers.new(name="Geometry Nodes", type="NODES")
+    mod.node_group = geo_tree
+
+    # Set values on the modifier explicitly (interface defaults don't always apply)
+    socket_ids = {
+        item.name: item.identifier
+        for item in geo_tree.interface.items_tree
+        if item.item_type == "SOCKET" and item.in_out == "INPUT"
+    }
+    mod[socket_ids["Max Splat Count"]] = max_splat_count
+    mod[socket_ids["Opacity Threshold"]] = opacity_threshold
+    mod[socket_ids["Scale Multiplier"]] = scale_multiplier
+    mod[socket_ids["Point Cloud Mode"]] = point_cloud_mode
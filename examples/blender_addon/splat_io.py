@@ -7,63 +7,298 @@ pre-activation form and converted here.
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
 
+# Debug logging costs real work on the import hot path (string formatting
+# and stdout flushes in Blender's UI process); keep it off by default.
+_DEBUG = os.environ.get("WL_SPLAT_DEBUG") == "1"
 
-def _sigmoid(x: np.ndarray) -> np.ndarray:
-    """Numerically stable sigmoid."""
-    return np.where(x >= 0, 1 / (1 + np.exp(-x)), np.exp(x) / (1 + np.exp(x)))
+try:
+    from scipy.special import expit as _expit
+except ImportError:  # scipy is not bundled with every Blender distribution
+    _expit = None
 
+# Import pxr once at module load rather than on every file import; repeated
+# `from pxr import Usd` inside the loader re-runs the (non-trivial) package
+# import machinery each call.
+try:
+    from pxr import Usd
+except ImportError:
+    Usd = None
 
-def _vt_array_to_numpy(vt_array, dtype=np.float32) -> np.ndarray:
-    """Convert USD Vt array to numpy, handling Vec3f/Color3f/Quatf types.
 
-    USD's Vec3fArray/Color3fArray sometimes don't convert to (N, 3) directly
-    with np.array(). This function ensures proper shape.
+def _aligned_empty(
+    shape: tuple[int, ...], dtype: np.dtype, align: int = 64
+) -> np.ndarray:
+    """Allocate a C-contiguous array whose data pointer is align-byte aligned.
+
+    Cacheline-aligned sources let Blender's foreach_set memcpy use aligned
+    SIMD loads instead of split-cacheline accesses.
     """
-    arr = np.array(vt_array, dtype=dtype)
+    dtype = np.dtype(dtype)
+    size = int(np.prod(shape)) * dtype.itemsize
+    buf = np.empty(size + align, dtype=np.uint8)
+    offset = (-buf.ctypes.data) % align
+    return buf[offset : offset + size].view(dtype).reshape(shape)
+
+
+def _aligned_array(arr: np.ndarray, dtype: np.dtype, align: int = 64) -> np.ndarray:
+    """Return arr as a C-contiguous, align-byte-aligned array of dtype."""
+    arr = np.asarray(arr)
+    if (
+        arr.dtype == dtype
+        and arr.flags["C_CONTIGUOUS"]
+        and arr.ctypes.data % align == 0
+    ):
+        return arr
+    out = _aligned_empty(arr.shape, dtype, align)
+    out[...] = arr
+    return out
+
+
+# Lookup table for the no-scipy sigmoid path: 4096 knots over [-8, 8]
+# (sigmoid saturates to within 4e-4 outside that range, and np.interp
+# clamps to the endpoint values). Interpolation error is far below the
+# 8-bit precision the viewport displays opacity at.
+_SIG_LUT_X = np.linspace(-8.0, 8.0, 4096, dtype=np.float32)
+_SIG_LUT_Y = (1.0 / (1.0 + np.exp(-_SIG_LUT_X.astype(np.float64)))).astype(np.float32)
+
+
+def _sigmoid(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """Numerically stable sigmoid, optionally written into ``out``.
+
+    Passing the input as ``out`` reuses its buffer and keeps the
+    activation allocation-free.
+    """
+    if _expit is not None:
+        return _expit(x) if out is None else _expit(x, out)
+    if x.size > 10000:
+        # Table lookup beats transcendental evaluation at splat counts
+        y = np.interp(x, _SIG_LUT_X, _SIG_LUT_Y)
+        if out is None:
+            return y.astype(np.float32, copy=False)
+        out[...] = y
+        return out
+    # Fallback: sigmoid(x) = 0.5 + 0.5*tanh(x/2) — one transcendental and
+    # one temporary, stable for both signs, all follow-ups in place
+    res = np.multiply(x, 0.5, out=out)
+    np.tanh(res, out=res)
+    res *= 0.5
+    res += 0.5
+    return res
+
+
+# Element layout (component count, element dtype) for the Vt array types
+# this loader sees, so conversion can reshape and decode directly instead
+# of probing element objects (or assuming 4-byte floats) per call.
+_VT_LAYOUTS = {
+    "Vec3fArray": (3, np.float32),
+    "Color3fArray": (3, np.float32),
+    "QuatfArray": (4, np.float32),
+    "FloatArray": (1, np.float32),
+    "Vec3hArray": (3, np.float16),
+    "QuathArray": (4, np.float16),
+    "HalfArray": (1, np.float16),
+    "UCharArray": (1, np.uint8),
+}
+
+
+# Conversion strategy per Vt array type, probed once per type on first
+# use so the per-call path is a single dict lookup.
+_VT_DISPATCH: dict[type, object] = {}
+
+
+def _vt_finish(arr: np.ndarray, vt_array, dtype) -> np.ndarray:
+    """Reshape/convert a raw converted array to the expected (N, C) form."""
+    layout = _VT_LAYOUTS.get(type(vt_array).__name__)
+    if layout is not None and layout[0] > 1 and arr.ndim == 1:
+        arr = arr.reshape(-1, layout[0])
+    if arr.dtype != dtype:
+        arr = arr.astype(dtype, copy=False)
+    return arr
+
+
+def _vt_via_buffer(vt_array, dtype) -> np.ndarray:
+    """Wrap the Vt array's buffer directly (zero-copy at most a memcpy)."""
+    return _vt_finish(np.asarray(memoryview(vt_array)), vt_array, dtype)
+
+
+def _vt_via_bytes(vt_array, dtype) -> np.ndarray:
+    """Convert via bytes() for Vt subtypes without the buffer protocol.
+
+    Decodes with the element dtype from _VT_LAYOUTS; guessing float32
+    for an unknown type would produce silent garbage geometry.
+    """
+    layout = _VT_LAYOUTS.get(type(vt_array).__name__)
+    if layout is None:
+        raise TypeError(
+            f"unknown element layout for Vt type {type(vt_array).__name__}"
+        )
+    arr = np.frombuffer(bytes(vt_array), dtype=layout[1])
+    return _vt_finish(arr, vt_array, dtype)
+
+
+def _vt_generic(vt_array, dtype) -> np.ndarray:
+    """Slow path for opaque element types."""
+    layout = _VT_LAYOUTS.get(type(vt_array).__name__)
+    n_components = layout[0] if layout is not None else None
+    arr = np.asarray(vt_array, dtype=dtype)
 
     # If already the right shape, return as-is
     if arr.ndim == 2:
         return arr
 
-    # If 1D array of compound types, try to reshape
+    # If 1D array of compound types, reshape (probing the first element
+    # only when the Vt type is not in the known-components table)
     if arr.ndim == 1 and len(arr) > 0:
-        # Check if elements are iterable (Vec3f, Color3f, etc.)
-        try:
-            first = arr[0]
-            if hasattr(first, "__len__"):
-                n_components = len(first)
-                return np.array(
-                    [[v[i] for i in range(n_components)] for v in arr], dtype=dtype
-                )
-        except (TypeError, IndexError):
-            pass
+        if n_components is None:
+            try:
+                first = arr[0]
+                if hasattr(first, "__len__"):
+                    n_components = len(first)
+            except (TypeError, IndexError):
+                pass
+        if n_components is not None and n_components > 1:
+            # fromiter with an explicit count writes straight into one
+            # pre-sized buffer; no intermediate lists, no reshape copy
+            flat = np.fromiter(
+                (x for v in arr for x in v),
+                dtype=dtype,
+                count=len(arr) * n_components,
+            )
+            return flat.reshape(-1, n_components)
 
     return arr
 
 
+def _pick_vt_handler(vt_array):
+    """Probe which conversion strategy works for this Vt array type."""
+    try:
+        if np.asarray(memoryview(vt_array)).dtype != np.object_:
+            return _vt_via_buffer
+    except TypeError:
+        pass
+    try:
+        bytes(vt_array)
+    except TypeError:
+        return _vt_generic
+    # The bytes path needs a known element layout to decode correctly
+    if type(vt_array).__name__ in _VT_LAYOUTS:
+        return _vt_via_bytes
+    return _vt_generic
+
+
+def _vt_array_to_numpy(vt_array, dtype=np.float32) -> np.ndarray:
+    """Convert USD Vt array to numpy, handling Vec3f/Color3f/Quatf types.
+
+    USD's Vec3fArray/Color3fArray sometimes don't convert to (N, 3)
+    directly with np.array(). Vt arrays are homogeneous per type, so the
+    working strategy is probed once per type and cached.
+    """
+    handler = _VT_DISPATCH.get(type(vt_array))
+    if handler is None:
+        handler = _pick_vt_handler(vt_array)
+        _VT_DISPATCH[type(vt_array)] = handler
+    return handler(vt_array, dtype)
+
+
+def _vt_to_f32(vt_array, cols: int) -> np.ndarray:
+    """Convert a Vt array to a C-contiguous float32 (N, cols) array.
+
+    Guarantees the layout downstream code relies on: `.ravel()` is a view
+    and foreach_set hits the buffer-compatible memcpy path.
+    """
+    arr = _vt_array_to_numpy(vt_array, dtype=np.float32)
+    if cols > 1 and arr.ndim == 1:
+        arr = arr.reshape(-1, cols)
+    return np.ascontiguousarray(arr, dtype=np.float32)
+
+
 @dataclass
 class GaussianData:
-    """Gaussian splat data in numpy format (post-activation)."""
+    """Gaussian splat data in numpy format (post-activation).
 
-    positions: np.ndarray  # (N, 3)
-    scales: np.ndarray  # (N, 3) - activated (post-exp)
-    rotations: np.ndarray  # (N, 4) quaternions (w, x, y, z)
-    opacities: np.ndarray  # (N,) - activated (post-sigmoid)
-    colors: np.ndarray  # (N, 3) RGB
+    All arrays are C-contiguous and 64-byte aligned. Positions are
+    float32; scales/rotations/opacities are float16 and colors are uint8
+    to shrink the resident footprint (splat files quantize them anyway).
+    Everything is upcast to float32 only at the point of upload into
+    Blender. Loaders must uphold this contract.
+    """
+
+    positions: np.ndarray  # (N, 3) float32
+    scales: np.ndarray  # (N, 3) float16 - activated (post-exp)
+    rotations: np.ndarray  # (N, 4) float16 quaternions (w, x, y, z)
+    opacities: np.ndarray  # (N,) float16 - activated (post-sigmoid)
+    colors: np.ndarray  # (N, 3) uint8 RGB (0-255)
+    max_scale: np.ndarray  # (N,) float16 - per-splat max of scales, baked
+    # once so the node graphs read a scalar attribute instead of reducing
+    # the scale vector per point per frame
 
 
 SUPPORTED_EXTENSIONS = {".usdz"}
+# Pre-joined display/error string; the set never changes at runtime.
+SUPPORTED_EXTENSIONS_STR = ", ".join(sorted(SUPPORTED_EXTENSIONS))
+
+
+def filter_gaussians(
+    data: GaussianData, max_count: int, opacity_threshold: float
+) -> GaussianData:
+    """Prefilter splats by opacity, keeping at most max_count by scale.
+
+    Running the filter once in numpy at import time keeps the point count
+    entering Blender's geometry-nodes evaluator at or below max_count,
+    instead of deleting and sorting the full cloud on every redraw. The
+    node-group sliders remain usable to tighten the limits further.
+    """
+    mask = data.opacities >= opacity_threshold
+    if not mask.all():
+        data = _index_gaussians(data, mask)
+    if len(data.positions) > max_count:
+        # Loaders return splats pre-sorted descending by max scale, so the
+        # top-K is simply the head of each array
+        data = _index_gaussians(data, slice(max_count))
+    return data
+
+
+def _index_gaussians(data: GaussianData, index) -> GaussianData:
+    """Apply a boolean mask, index array, or slice to every field of data."""
+    return GaussianData(
+        positions=data.positions[index],
+        scales=data.scales[index],
+        rotations=data.rotations[index],
+        opacities=data.opacities[index],
+        colors=data.colors[index],
+        max_scale=data.max_scale[index],
+    )
+
+
+# Bump when the GaussianData layout changes so stale caches are ignored.
+_CACHE_VERSION = 1
+
+
+def _cache_path(path: Path) -> Path | None:
+    """Return the decode-cache path for a splat file, or None if unstatable.
+
+    Keyed on mtime and size, which is far cheaper than hashing the bytes
+    and invalidates whenever the file is re-downloaded.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return path.with_suffix(f".v{_CACHE_VERSION}-{st.st_mtime_ns}-{st.st_size}.npz")
 
 
 def load_splat(filepath: str) -> GaussianData:
     """Load Gaussian splat data from a file.
 
-    Automatically dispatches to the appropriate loader based on file extension.
+    Automatically dispatches to the appropriate loader based on file
+    extension. Decoded results are cached next to the file as an .npz so
+    re-importing the same world skips the parse and activation work.
 
     Args:
         filepath: Path to the splat file.
@@ -77,11 +312,43 @@ def load_splat(filepath: str) -> GaussianData:
     path = Path(filepath)
     ext = path.suffix.lower()
 
-    if ext == ".usdz":
-        return _load_usdz(filepath)
-    else:
-        supported = ", ".join(sorted(SUPPORTED_EXTENSIONS))
-        raise ValueError(f"Unsupported file format: {ext}. Supported: {supported}")
+    try:
+        loader = _LOADERS[ext]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported file format: {ext}. Supported: {SUPPORTED_EXTENSIONS_STR}"
+        ) from None
+
+    cache = _cache_path(path)
+    if cache is not None and cache.exists():
+        # Cache hit: savez stores the raw post-activation buffers, so this
+        # is a straight read with no USD parse or activation passes
+        with np.load(cache) as npz:
+            return GaussianData(**{name: npz[name] for name in npz.files})
+
+    data = loader(filepath)
+
+    if cache is not None:
+        # Caching is best-effort; drop caches from older versions of the
+        # file first so they don't accumulate
+        for stale in path.parent.glob(f"{path.stem}.v*-*.npz"):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+        try:
+            np.savez(
+                cache,
+                positions=data.positions,
+                scales=data.scales,
+                rotations=data.rotations,
+                opacities=data.opacities,
+                colors=data.colors,
+                max_scale=data.max_scale,
+            )
+        except OSError:
+            pass  # read-only location; skip caching
+    return data
 
 
 def _load_usdz(filepath: str) -> GaussianData:
@@ -91,37 +358,84 @@ def _load_usdz(filepath: str) -> GaussianData:
         - scales: log-scale -> apply exp
         - densities: logit -> apply sigmoid
     """
-    try:
-        from pxr import Usd
-    except ImportError as e:
+    if Usd is None:
         raise ImportError(
             "`from pxr import Usd` failed. Upgrade your Blender version to 4.0+,\n"
             "or install usd-core in Blender's Python:\n"
             "  /path/to/blender/python -m pip install usd-core"
-        ) from e
+        )
 
     stage = Usd.Stage.Open(filepath)
     prim = stage.GetDefaultPrim()
 
+    # Resolve value sources once up front; Usd.AttributeQuery caches the
+    # composition lookup so the reads below skip re-resolution. Passing an
+    # explicit Default time code also skips time-sample resolution (splat
+    # attributes are not animated).
+    queries = {
+        name: Usd.AttributeQuery(prim.GetAttribute(name))
+        for name in (
+            "positions",
+            "scales",
+            "rotations",
+            "densities",
+            "features_albedo",
+        )
+    }
+    default_time = Usd.TimeCode.Default()
+    values = {name: query.Get(default_time) for name, query in queries.items()}
+
     # Positions (N, 3) - direct
-    positions = _vt_array_to_numpy(prim.GetAttribute("positions").Get())
-    print(f"[DEBUG] imported splat positions shape: {positions.shape}")
+    positions = _vt_to_f32(values["positions"], 3)
+    if _DEBUG:
+        print(f"[DEBUG] imported splat positions shape: {positions.shape}")
 
-    # Scales (N, 3) - stored as log-scale, apply exp
-    scales_raw = _vt_array_to_numpy(prim.GetAttribute("scales").Get())
-    scales = np.exp(scales_raw)
+    # Scales (N, 3) - stored as log-scale, apply exp in place when the
+    # freshly-loaded buffer is ours to reuse (zero-copy Vt views may be
+    # read-only)
+    scales_raw = _vt_to_f32(values["scales"], 3)
+    if scales_raw.flags.writeable:
+        scales = np.exp(scales_raw, out=scales_raw)
+    else:
+        scales = np.exp(scales_raw)
     # Rotations (N, 4) - quaternions (w, x, y, z), direct
-    rotations = _vt_array_to_numpy(prim.GetAttribute("rotations").Get())
-    # Densities (N,) - stored as logit, apply sigmoid
-    densities_raw = np.array(prim.GetAttribute("densities").Get(), dtype=np.float32)
-    opacities = _sigmoid(densities_raw)
-    # Colors (N, 3) - RGB, direct
-    colors = _vt_array_to_numpy(prim.GetAttribute("features_albedo").Get())
+    rotations = _vt_to_f32(values["rotations"], 4)
+    # Densities (N,) - stored as logit, apply sigmoid. Keep the buffer
+    # contiguous float32 so the elementwise activation stays memory-lean
+    # and is not silently promoted to float64.
+    densities_raw = np.ascontiguousarray(values["densities"], dtype=np.float32)
+    opacities = _sigmoid(
+        densities_raw, out=densities_raw if densities_raw.flags.writeable else None
+    )
+    # Colors (N, 3) - RGB, quantized to uint8 (8 bits matches what the
+    # viewport displays; see GaussianData). Quantized exports already
+    # store uint8, as a flat (3N,) UCharArray — pass those through.
+    colors_any = np.asarray(values["features_albedo"])
+    if colors_any.dtype == np.uint8:
+        colors_u8 = np.ascontiguousarray(colors_any).reshape(-1, 3)
+    else:
+        colors = _vt_to_f32(values["features_albedo"], 3)
+        colors_u8 = (np.clip(colors, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+
+    # Bake the descending-by-max-scale permutation once, so the limit
+    # filter downstream reduces to "keep the first N" with no per-frame
+    # sort in the geometry-nodes evaluator
+    max_scale = scales.max(axis=1)
+    order = np.argsort(-max_scale)
 
+    # Uphold the GaussianData contract: aligned, contiguous, float32
+    # positions and float16 attributes (upcast only at foreach_set time)
     return GaussianData(
-        positions=positions,
-        scales=scales,
-        rotations=rotations,
-        opacities=opacities,
-        colors=colors,
+        positions=_aligned_array(positions[order], np.float32),
+        scales=_aligned_array(scales[order], np.float16),
+        rotations=_aligned_array(rotations[order], np.float16),
+        opacities=_aligned_array(opacities[order], np.float16),
+        colors=_aligned_array(colors_u8[order], np.uint8),
+        max_scale=_aligned_array(max_scale[order], np.float16),
     )
+
+
+# Per-extension loader registry; load_splat dispatches through this so
+# future formats (PLY, SPZ) just register here. Keep SUPPORTED_EXTENSIONS
+# in sync with the keys.
+_LOADERS = {".usdz": _load_usdz}
@@ -6,16 +6,12 @@ import pathlib
 
 import structlog
 
+from _logging import configure_logging
 from worldlabs_api.client import WorldLabsClient
 from worldlabs_api.helpers.spz import download_spz, load_spz
 from worldlabs_api.helpers.usdz import save_usdz
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.add_log_level,
-        structlog.dev.ConsoleRenderer(),
-    ],
-)
+configure_logging()
 logger = structlog.get_logger(__name__)
 
 
@@ -6,15 +6,11 @@ import time
 
 import structlog
 
+from _logging import configure_logging
 from worldlabs_api.client import AsyncWorldLabsClient
 from worldlabs_api.models import WorldTextPrompt, WorldsGenerateRequest
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.add_log_level,
-        structlog.dev.ConsoleRenderer(),
-    ],
-)
+configure_logging()
 logger = structlog.get_logger(__name__)
 
 
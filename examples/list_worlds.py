@@ -1,43 +1,58 @@
 """List all worlds and their metadata."""
 
+import asyncio
 import os
 
 import structlog
 
-from worldlabs_api.client import WorldLabsClient
+from _logging import configure_logging
+from worldlabs_api.client import AsyncWorldLabsClient
 from worldlabs_api.models import ListWorldsRequest
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.add_log_level,
-        structlog.dev.ConsoleRenderer(),
-    ],
-)
+configure_logging()
 logger = structlog.get_logger(__name__)
 
 
-def main() -> None:
+async def fetch_all_worlds(client: AsyncWorldLabsClient) -> list:
+    """Fetch all worlds, prefetching the next page while processing.
+
+    The request for page N+1 is in flight while page N is being consumed,
+    so pagination latency overlaps with local work instead of adding up
+    serially.
+    """
+    all_worlds = []
+    next_task = asyncio.create_task(
+        client.list_worlds(ListWorldsRequest(page_size=100, sort_by="created_at"))
+    )
+    while next_task is not None:
+        response = await next_task
+        if response.next_page_token:
+            next_task = asyncio.create_task(
+                client.list_worlds(
+                    ListWorldsRequest(
+                        page_size=100,
+                        page_token=response.next_page_token,
+                        sort_by="created_at",
+                    )
+                )
+            )
+        else:
+            next_task = None
+        all_worlds.extend(response.worlds)
+    return all_worlds
+
+
+async def async_main() -> list:
     api_key = os.environ.get("WORLDLABS_API_KEY")
     if not api_key:
         raise RuntimeError("Set WORLDLABS_API_KEY")
 
-    with WorldLabsClient(api_key=api_key) as client:
-        # Fetch all worlds, paginating if necessary
-        all_worlds = []
-        page_token = None
+    async with AsyncWorldLabsClient(api_key=api_key) as client:
+        return await fetch_all_worlds(client)
 
-        while True:
-            request = ListWorldsRequest(
-                page_size=100,
-                page_token=page_token,
-                sort_by="created_at",
-            )
-            response = client.list_worlds(request)
-            all_worlds.extend(response.worlds)
 
-            if not response.next_page_token:
-                break
-            page_token = response.next_page_token
+def main() -> None:
+    all_worlds = asyncio.run(async_main())
 
     print(f"\n{'='*80}")
     print(f"Found {len(all_worlds)} worlds")
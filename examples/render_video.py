@@ -6,16 +6,12 @@ import pathlib
 
 import structlog
 
+from _logging import configure_logging
 from worldlabs_api.client import WorldLabsClient
 from worldlabs_api.helpers.render import make_turntable_cameras, render_video
 from worldlabs_api.helpers.spz import download_spz, load_spz
 
-structlog.configure(
-    processors=[
-        structlog.stdlib.add_log_level,
-        structlog.dev.ConsoleRenderer(),
-    ],
-)
+configure_logging()
 logger = structlog.get_logger(__name__)
 
 
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import time
+import weakref
 from typing import Any
 
 import httpx
@@ -13,6 +15,12 @@ from worldlabs_api import models
 
 logger = structlog.get_logger(__name__)
 
+# Parametrize the generic once: Operation[World] is the return type of
+# every generate/poll call, and subscripting re-enters pydantic's
+# generic-cache machinery on each use. The concrete class carries its
+# compiled validator, so model_validate_json on it is a straight call.
+_OperationWorld = models.Operation[models.World]
+
 
 class WorldLabsClient:
     """Synchronous client for the World Labs public API."""
@@ -24,8 +32,18 @@ class WorldLabsClient:
         timeout_seconds: float = 60.0,
     ) -> None:
         self._api_key = api_key
-        self._base_url = base_url.rstrip("/")
-        self._client = httpx.Client(timeout=timeout_seconds)
+        # All calls target one host: HTTP/2 + keep-alive multiplexes them
+        # over a single TLS connection instead of re-handshaking
+        self._client = httpx.Client(
+            base_url=base_url.rstrip("/"),
+            http2=True,
+            timeout=timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0,
+            ),
+        )
 
     def close(self) -> None:
         self._client.close()
@@ -42,21 +60,18 @@ class WorldLabsClient:
             "WLT-Api-Key": self._api_key,
         }
 
-    def _url(self, path: str) -> str:
-        return f"{self._base_url}{path}"
-
     def _request(
         self,
         method: str,
         path: str,
-        json_data: dict[str, Any] | None = None,
+        content: bytes | None = None,
         params: dict[str, Any] | None = None,
     ) -> httpx.Response:
         response = self._client.request(
             method,
-            self._url(path),
+            path,
             headers=self._headers(),
-            json=json_data,
+            content=content,
             params=params,
         )
         response.raise_for_status()
@@ -68,16 +83,18 @@ class WorldLabsClient:
         response = self._request(
             "POST",
             "/marble/v1/media-assets:prepare_upload",
-            json_data=request.model_dump(exclude_none=True),
+            # model_dump_json serializes model -> JSON bytes in one pass in
+            # Rust, skipping the intermediate dict and stdlib json.dumps
+            content=request.model_dump_json(exclude_none=True).encode(),
         )
-        return models.MediaAssetPrepareUploadResponse.model_validate(response.json())
+        return models.MediaAssetPrepareUploadResponse.model_validate_json(response.content)
 
     def get_media_asset(self, media_asset_id: str) -> models.MediaAsset:
         response = self._request(
             "GET",
             f"/marble/v1/media-assets/{media_asset_id}",
         )
-        return models.MediaAsset.model_validate(response.json())
+        return models.MediaAsset.model_validate_json(response.content)
 
     def generate_world(
         self, request: models.WorldsGenerateRequest
@@ -85,9 +102,9 @@ class WorldLabsClient:
         response = self._request(
             "POST",
             "/marble/v1/worlds:generate",
-            json_data=request.model_dump(exclude_none=True),
+            content=request.model_dump_json(exclude_none=True).encode(),
         )
-        return models.Operation[models.World].model_validate(response.json())
+        return _OperationWorld.model_validate_json(response.content)
 
     def get_world(self, world_id: str) -> models.World:
         response = self._request("GET", f"/marble/v1/worlds/{world_id}")
@@ -99,25 +116,38 @@ class WorldLabsClient:
     def list_worlds(
         self, request: models.ListWorldsRequest | None = None
     ) -> models.ListWorldsResponse:
-        json_data = request.model_dump(exclude_none=True) if request else {}
-        response = self._request("POST", "/marble/v1/worlds:list", json_data=json_data)
-        return models.ListWorldsResponse.model_validate(response.json())
+        content = (
+            request.model_dump_json(exclude_none=True).encode() if request else b"{}"
+        )
+        response = self._request("POST", "/marble/v1/worlds:list", content=content)
+        return models.ListWorldsResponse.model_validate_json(response.content)
 
     def get_operation(self, operation_id: str) -> models.Operation[models.World]:
         response = self._request(
             "GET",
             f"/marble/v1/operations/{operation_id}",
         )
-        return models.Operation[models.World].model_validate(response.json())
+        return _OperationWorld.model_validate_json(response.content)
 
     def poll_operation(
         self,
         operation_id: str,
-        interval_seconds: float = 5.0,
+        interval_seconds: float = 1.0,
+        max_interval_seconds: float = 10.0,
+        backoff_factor: float = 1.5,
+        jitter_seconds: float = 0.5,
         timeout_seconds: float | None = 600.0,
     ) -> models.Operation[models.World]:
-        """Poll an operation until done or timeout."""
+        """Poll an operation until done or timeout.
+
+        The wait starts at interval_seconds and grows by backoff_factor up
+        to max_interval_seconds, so fast operations return quickly while
+        long ones send far fewer requests than a fixed short interval. A
+        uniform jitter of up to jitter_seconds decorrelates concurrent
+        pollers so they don't hit the server in lockstep.
+        """
         start = time.time()
+        interval = interval_seconds
         while True:
             operation = self.get_operation(operation_id)
             if operation.done:
@@ -128,7 +158,36 @@ class WorldLabsClient:
                     raise TimeoutError(
                         "Operation did not complete within the timeout"
                     )
-            time.sleep(interval_seconds)
+            time.sleep(interval + random.uniform(0.0, jitter_seconds))
+            interval = min(interval * backoff_factor, max_interval_seconds)
+
+
+# Shared async clients, one per running event loop: client instances
+# created per request would each open their own connection pool, so API
+# calls and helper downloads could never multiplex over a single HTTP/2
+# connection. Keyed weakly on the loop itself so a client created under
+# one asyncio.run() is never reused (with connections bound to the dead
+# loop) by the next, and entries vanish with their loop.
+_shared_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+
+def get_shared_async_client() -> httpx.AsyncClient:
+    """Return the lazily-created shared async client for the running loop."""
+    loop = asyncio.get_running_loop()
+    client = _shared_async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0,
+            ),
+        )
+        _shared_async_clients[loop] = client
+    return client
 
 
 class AsyncWorldLabsClient:
@@ -139,13 +198,25 @@ class AsyncWorldLabsClient:
         api_key: str,
         base_url: str = "https://api.worldlabs.ai",
         timeout_seconds: float = 60.0,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
-        self._client = httpx.AsyncClient(timeout=timeout_seconds)
+        self._timeout = timeout_seconds
+        # None means "resolve the shared per-loop client at request time",
+        # so several AsyncWorldLabsClient instances multiplex over one
+        # connection pool instead of fragmenting it — and none of them
+        # can tear that pool down under the others
+        self._client = client
 
     async def close(self) -> None:
-        await self._client.aclose()
+        """Close an explicitly-provided client; a no-op on the shared one.
+
+        The shared per-loop client stays open so sibling instances keep
+        their pooled connections; it is discarded with its event loop.
+        """
+        if self._client is not None:
+            await self._client.aclose()
 
     async def __aenter__(self) -> "AsyncWorldLabsClient":
         return self
@@ -159,22 +230,21 @@ class AsyncWorldLabsClient:
             "WLT-Api-Key": self._api_key,
         }
 
-    def _url(self, path: str) -> str:
-        return f"{self._base_url}{path}"
-
     async def _request(
         self,
         method: str,
         path: str,
-        json_data: dict[str, Any] | None = None,
+        content: bytes | None = None,
         params: dict[str, Any] | None = None,
     ) -> httpx.Response:
-        response = await self._client.request(
+        client = self._client if self._client is not None else get_shared_async_client()
+        response = await client.request(
             method,
-            self._url(path),
+            self._base_url + path,
             headers=self._headers(),
-            json=json_data,
+            content=content,
             params=params,
+            timeout=self._timeout,
         )
         response.raise_for_status()
         return response
@@ -185,16 +255,16 @@ class AsyncWorldLabsClient:
         response = await self._request(
             "POST",
             "/marble/v1/media-assets:prepare_upload",
-            json_data=request.model_dump(exclude_none=True),
+            content=request.model_dump_json(exclude_none=True).encode(),
         )
-        return models.MediaAssetPrepareUploadResponse.model_validate(response.json())
+        return models.MediaAssetPrepareUploadResponse.model_validate_json(response.content)
 
     async def get_media_asset(self, media_asset_id: str) -> models.MediaAsset:
         response = await self._request(
             "GET",
             f"/marble/v1/media-assets/{media_asset_id}",
         )
-        return models.MediaAsset.model_validate(response.json())
+        return models.MediaAsset.model_validate_json(response.content)
 
     async def generate_world(
         self, request: models.WorldsGenerateRequest
@@ -202,9 +272,9 @@ class AsyncWorldLabsClient:
         response = await self._request(
             "POST",
             "/marble/v1/worlds:generate",
-            json_data=request.model_dump(exclude_none=True),
+            content=request.model_dump_json(exclude_none=True).encode(),
         )
-        return models.Operation[models.World].model_validate(response.json())
+        return _OperationWorld.model_validate_json(response.content)
 
     async def get_world(self, world_id: str) -> models.World:
         response = await self._request("GET", f"/marble/v1/worlds/{world_id}")
@@ -216,25 +286,38 @@ class AsyncWorldLabsClient:
     async def list_worlds(
         self, request: models.ListWorldsRequest | None = None
     ) -> models.ListWorldsResponse:
-        json_data = request.model_dump(exclude_none=True) if request else {}
-        response = await self._request("POST", "/marble/v1/worlds:list", json_data=json_data)
-        return models.ListWorldsResponse.model_validate(response.json())
+        content = (
+            request.model_dump_json(exclude_none=True).encode() if request else b"{}"
+        )
+        response = await self._request("POST", "/marble/v1/worlds:list", content=content)
+        return models.ListWorldsResponse.model_validate_json(response.content)
 
     async def get_operation(self, operation_id: str) -> models.Operation[models.World]:
         response = await self._request(
             "GET",
             f"/marble/v1/operations/{operation_id}",
         )
-        return models.Operation[models.World].model_validate(response.json())
+        return _OperationWorld.model_validate_json(response.content)
 
     async def poll_operation(
         self,
         operation_id: str,
-        interval_seconds: float = 5.0,
+        interval_seconds: float = 1.0,
+        max_interval_seconds: float = 10.0,
+        backoff_factor: float = 1.5,
+        jitter_seconds: float = 0.5,
         timeout_seconds: float | None = 600.0,
     ) -> models.Operation[models.World]:
-        """Poll an operation until done or timeout."""
+        """Poll an operation until done or timeout.
+
+        The wait starts at interval_seconds and grows by backoff_factor up
+        to max_interval_seconds, so fast operations return quickly while
+        long ones send far fewer requests than a fixed short interval. A
+        uniform jitter of up to jitter_seconds decorrelates concurrent
+        pollers so they don't hit the server in lockstep.
+        """
         start = time.time()
+        interval = interval_seconds
         while True:
             operation = await self.get_operation(operation_id)
             if operation.done:
@@ -245,4 +328,5 @@ class AsyncWorldLabsClient:
                     raise TimeoutError(
                         "Operation did not complete within the timeout"
                     )
-            await asyncio.sleep(interval_seconds)
+            await asyncio.sleep(interval + random.uniform(0.0, jitter_seconds))
+            interval = min(interval * backoff_factor, max_interval_seconds)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
 import torch
 
 
@@ -48,8 +49,31 @@ class Gaussian3D:
                 f"feature (RGB) must have shape (N, 3), got {self.feature.shape}"
             )
 
+    @classmethod
+    def unchecked(
+        cls,
+        *,
+        mean: torch.Tensor,
+        scale: torch.Tensor,
+        quaternion: torch.Tensor,
+        opacity: torch.Tensor,
+        feature: torch.Tensor,
+    ) -> "Gaussian3D":
+        """Construct without running validate(), for known-good tensors.
+
+        Device/dtype copies of an already-validated instance cannot change
+        shapes, so re-checking them on every to() is wasted work.
+        """
+        obj = object.__new__(cls)
+        obj.mean = mean
+        obj.scale = scale
+        obj.quaternion = quaternion
+        obj.opacity = opacity
+        obj.feature = feature
+        return obj
+
     def to(self, device: torch.device | str) -> "Gaussian3D":
-        return Gaussian3D(
+        return Gaussian3D.unchecked(
             mean=self.mean.to(device),
             scale=self.scale.to(device),
             quaternion=self.quaternion.to(device),
@@ -78,31 +102,80 @@ class Camera:
         return torch.linalg.inv(self.camera_to_world)
 
     def intrinsics_matrix(self) -> torch.Tensor:
-        return torch.tensor(
-            [
-                [self.fx, 0.0, self.cx],
-                [0.0, self.fy, self.cy],
-                [0.0, 0.0, 1.0],
-            ],
-            dtype=self.camera_to_world.dtype,
-            device=self.camera_to_world.device,
-        )
+        # Intrinsics are immutable in practice; build the tensor once per
+        # camera instead of on every call
+        cached = getattr(self, "_k_cache", None)
+        if cached is None:
+            cached = torch.tensor(
+                [
+                    [self.fx, 0.0, self.cx],
+                    [0.0, self.fy, self.cy],
+                    [0.0, 0.0, 1.0],
+                ],
+                dtype=self.camera_to_world.dtype,
+                device=self.camera_to_world.device,
+            )
+            self._k_cache = cached
+        return cached
 
     def to(self, device: torch.device | str) -> "Camera":
-        return Camera(
-            height=self.height,
-            width=self.width,
-            fx=self.fx,
-            fy=self.fy,
-            cx=self.cx,
-            cy=self.cy,
-            camera_to_world=self.camera_to_world.to(device),
-        )
+        # Skip __post_init__'s shape check: a device copy of a validated
+        # 4x4 matrix is still 4x4
+        obj = object.__new__(Camera)
+        obj.height = self.height
+        obj.width = self.width
+        obj.fx = self.fx
+        obj.fy = self.fy
+        obj.cx = self.cx
+        obj.cy = self.cy
+        obj.camera_to_world = self.camera_to_world.to(device)
+        return obj
 
 
 def stack_cameras(cameras: list[Camera]) -> tuple[torch.Tensor, torch.Tensor]:
-    """Return stacked (viewmats, Ks) tensors for gsplat."""
+    """Return stacked (viewmats, Ks) tensors for gsplat.
+
+    Inverts the stacked (N, 4, 4) camera-to-world tensor in one batched op
+    and assembles all intrinsics in a single host array, instead of N
+    separate 4x4 inversions and N tiny tensor constructions.
+    """
+
+    c2w = torch.stack([camera.camera_to_world for camera in cameras])
+    viewmats = torch.linalg.inv(c2w)
+
+    ks_np = np.zeros((len(cameras), 3, 3), dtype=np.float32)
+    for i, camera in enumerate(cameras):
+        ks_np[i, 0, 0] = camera.fx
+        ks_np[i, 1, 1] = camera.fy
+        ks_np[i, 0, 2] = camera.cx
+        ks_np[i, 1, 2] = camera.cy
+        ks_np[i, 2, 2] = 1.0
+    ks = torch.from_numpy(ks_np).to(device=c2w.device, dtype=c2w.dtype)
+    return viewmats, ks
+
+
+def stack_cameras_to(
+    cameras: list[Camera], device: torch.device | str
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Return stacked (viewmats, Ks) on device with one transfer each.
+
+    Unlike per-camera .to(device) followed by stack_cameras, this gathers
+    all extrinsics and intrinsics into host numpy arrays first, moves each
+    to the device as a single (N, 4, 4) / (N, 3, 3) copy, and runs the
+    batched inversion on the target device.
+    """
 
-    viewmats = torch.stack([camera.world_to_camera() for camera in cameras])
-    ks = torch.stack([camera.intrinsics_matrix() for camera in cameras])
+    n = len(cameras)
+    c2w_np = np.empty((n, 4, 4), dtype=np.float32)
+    ks_np = np.zeros((n, 3, 3), dtype=np.float32)
+    for i, camera in enumerate(cameras):
+        c2w_np[i] = camera.camera_to_world.detach().cpu().numpy()
+        ks_np[i, 0, 0] = camera.fx
+        ks_np[i, 1, 1] = camera.fy
+        ks_np[i, 0, 2] = camera.cx
+        ks_np[i, 1, 2] = camera.cy
+        ks_np[i, 2, 2] = 1.0
+    c2w = torch.from_numpy(c2w_np).to(device)
+    viewmats = torch.linalg.inv(c2w)
+    ks = torch.from_numpy(ks_np).to(device)
     return viewmats, ks
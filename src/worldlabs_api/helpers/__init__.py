@@ -2,11 +2,18 @@
 
 from worldlabs_api.helpers.export import save_ply
 from worldlabs_api.helpers.render import make_turntable_cameras, render_video
-from worldlabs_api.helpers.spz import download_spz, load_spz
+from worldlabs_api.helpers.spz import (
+    download_spz,
+    download_spz_async,
+    download_spz_many,
+    load_spz,
+)
 from worldlabs_api.helpers.usdz import save_usdz
 
 __all__ = [
     "download_spz",
+    "download_spz_async",
+    "download_spz_many",
     "load_spz",
     "make_turntable_cameras",
     "render_video",
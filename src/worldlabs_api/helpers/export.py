@@ -36,11 +36,19 @@ def save_ply(
         The output path.
     """
 
-    # Convert activated values back to raw format for gsplat
-    log_scales = torch.log(gaussians.scale)
-    opacities_logit = torch.logit(gaussians.opacity.squeeze(-1).clamp(1e-6, 1 - 1e-6))
-    sh0 = ((gaussians.feature - 0.5) / SH_C0).unsqueeze(1)  # (N, 1, 3)
-    shN = torch.zeros(gaussians.mean.shape[0], 0, 3)  # No higher-order SH
+    # Convert activated values back to raw format for gsplat. Each field
+    # is cloned once and then mutated in place, so peak memory stays at
+    # one copy per field instead of one per intermediate expression.
+    log_scales = gaussians.scale.detach().clone()
+    log_scales.log_()
+    opacities_logit = gaussians.opacity.detach().clone().squeeze_(-1)
+    opacities_logit.clamp_(1e-6, 1 - 1e-6).logit_()
+    sh0 = gaussians.feature.detach().clone()
+    sh0.sub_(0.5).div_(SH_C0)
+    sh0 = sh0.unsqueeze(1)  # (N, 1, 3)
+    shN = torch.empty(
+        gaussians.mean.shape[0], 0, 3, device=gaussians.mean.device
+    )  # No higher-order SH
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -4,32 +4,64 @@ from __future__ import annotations
 
 import math
 import pathlib
-from typing import Iterable
+from typing import Iterable, Iterator
 
 import gsplat
 import mediapy as media
 import numpy as np
 import torch
 
-from worldlabs_api.gaussian import Camera, Gaussian3D, stack_cameras
+from worldlabs_api.gaussian import Camera, Gaussian3D, stack_cameras_to
 
 
 def look_at(camera_pos: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
     """Return a camera-to-world matrix looking from camera_pos to target."""
 
-    forward = target - camera_pos
-    forward = forward / torch.linalg.norm(forward)
-    up = torch.tensor([0.0, 1.0, 0.0], dtype=camera_pos.dtype)
-    right = torch.cross(forward, up, dim=-1)
-    right = right / torch.linalg.norm(right)
+    # All math runs in numpy on the two 3-vectors: per-op torch dispatch
+    # overhead dwarfs the actual FLOPs at this size. Cross products with
+    # up = (0, 1, 0) are expanded by hand.
+    pos = camera_pos.detach().cpu().numpy().astype(np.float64)
+    forward = target.detach().cpu().numpy().astype(np.float64) - pos
+    forward /= np.linalg.norm(forward)
+    fx, fy, fz = forward
+    right = np.array([-fz, 0.0, fx])  # cross(forward, up)
+    right /= np.linalg.norm(right)
+    rx, ry, rz = right
+    true_up = np.array(  # cross(right, forward)
+        [ry * fz - rz * fy, rz * fx - rx * fz, rx * fy - ry * fx]
+    )
+
+    # OpenCV convention: +Y is up, +Z is forward
+    camera_to_world = np.eye(4, dtype=np.float64)
+    camera_to_world[:3, 0] = right
+    camera_to_world[:3, 1] = -true_up
+    camera_to_world[:3, 2] = forward
+    camera_to_world[:3, 3] = pos
+    return torch.from_numpy(camera_to_world).to(camera_pos.dtype)
+
+
+def look_at_batched(positions: torch.Tensor, target: torch.Tensor) -> torch.Tensor:
+    """Return (N, 4, 4) camera-to-world matrices from positions to target.
+
+    One batched pass replaces N look_at calls, whose per-call dispatch
+    overhead dwarfs the actual 3-vector math.
+    """
+
+    forward = target.unsqueeze(0) - positions
+    forward = forward / torch.linalg.norm(forward, dim=-1, keepdim=True)
+    up = torch.tensor([0.0, 1.0, 0.0], dtype=positions.dtype)
+    right = torch.cross(forward, up.expand_as(forward), dim=-1)
+    right = right / torch.linalg.norm(right, dim=-1, keepdim=True)
     true_up = torch.cross(right, forward, dim=-1)
 
     # OpenCV convention: +Y is up, +Z is forward
-    rotation = torch.stack([right, -true_up, forward], dim=1)
-    camera_to_world = torch.eye(4, dtype=camera_pos.dtype)
-    camera_to_world[:3, :3] = rotation
-    camera_to_world[:3, 3] = camera_pos
-    return camera_to_world
+    rotation = torch.stack([right, -true_up, forward], dim=2)
+    camera_to_worlds = torch.eye(4, dtype=positions.dtype).repeat(
+        positions.shape[0], 1, 1
+    )
+    camera_to_worlds[:, :3, :3] = rotation
+    camera_to_worlds[:, :3, 3] = positions
+    return camera_to_worlds
 
 
 def make_turntable_cameras(
@@ -43,30 +75,30 @@ def make_turntable_cameras(
     """Generate a simple turntable camera path around the origin."""
 
     focal = 0.5 * width / math.tan(math.radians(fov_degrees) / 2.0)
-    cameras: list[Camera] = []
-    for i in range(num_frames):
-        angle = 2 * math.pi * i / num_frames
-        position = torch.tensor(
-            [
-                radius * math.cos(angle),
-                elevation,
-                radius * math.sin(angle),
-            ],
-            dtype=torch.float32,
+    angles = torch.linspace(
+        0.0, 2.0 * math.pi, num_frames + 1, dtype=torch.float32
+    )[:-1]
+    positions = torch.stack(
+        [
+            radius * torch.cos(angles),
+            torch.full_like(angles, elevation),
+            radius * torch.sin(angles),
+        ],
+        dim=1,
+    )
+    camera_to_worlds = look_at_batched(positions, torch.zeros(3))
+    return [
+        Camera(
+            height=height,
+            width=width,
+            fx=focal,
+            fy=focal,
+            cx=width / 2.0,
+            cy=height / 2.0,
+            camera_to_world=camera_to_world,
         )
-        camera_to_world = look_at(position, torch.zeros(3))
-        cameras.append(
-            Camera(
-                height=height,
-                width=width,
-                fx=focal,
-                fy=focal,
-                cx=width / 2.0,
-                cy=height / 2.0,
-                camera_to_world=camera_to_world,
-            )
-        )
-    return cameras
+        for camera_to_world in camera_to_worlds
+    ]
 
 
 def render_gaussians(
@@ -81,7 +113,9 @@ def render_gaussians(
     """
 
     cameras_list = list(cameras)
-    viewmats, ks = stack_cameras([camera.to(device) for camera in cameras_list])
+    # One batched host-to-device copy for all camera matrices instead of
+    # a per-camera .to(device) plus per-camera stacking
+    viewmats, ks = stack_cameras_to(cameras_list, device)
 
     gaussians = gaussians.to(device)
     colors = gaussians.feature  # RGB only, shape (N, 3)
@@ -106,12 +140,44 @@ def render_gaussians(
         rgb = features
         if rgb.shape[-1] == 4:
             rgb = rgb[..., :3]
-        rgb = rgb.clamp(0, 1).detach().cpu().numpy()
-        alpha = alphas.clamp(0, 1).detach().cpu().numpy()
-        # Composite over white background
+        rgb = rgb.clamp(0, 1)
+        # Composite on the render device before the device-to-host copy,
+        # so the blend runs as fused kernels and the alpha channel never
+        # crosses PCIe
         if background_rgb is not None:
-            rgb = rgb * alpha + (1 - alpha) * background_rgb
-        return rgb
+            alpha = alphas.clamp(0, 1)
+            background = background_rgb.to(device=rgb.device, dtype=rgb.dtype)
+            rgb = rgb * alpha + (1 - alpha) * background
+        return rgb.detach().cpu().numpy()
+
+
+# Cameras rasterized per gsplat call in iter_render: large enough to
+# amortize projection/sort setup across frames, small enough to bound the
+# GPU framebuffer allocation.
+_RENDER_CHUNK_SIZE = 16
+
+
+def iter_render(
+    gaussians: Gaussian3D,
+    cameras: Iterable[Camera],
+    background_rgb: torch.Tensor | None = None,
+    device: str | torch.device = "cuda",
+    chunk_size: int = _RENDER_CHUNK_SIZE,
+) -> Iterator[np.ndarray]:
+    """Yield rendered (H, W, 3) frames, rasterizing chunk_size at a time.
+
+    Unlike render_gaussians, this never materializes the full frame stack:
+    GPU memory is bounded by chunk_size frames and host memory by one
+    chunk, regardless of path length.
+    """
+
+    gaussians = gaussians.to(device)
+    cameras_list = list(cameras)
+    for start in range(0, len(cameras_list), chunk_size):
+        chunk = cameras_list[start : start + chunk_size]
+        yield from render_gaussians(
+            gaussians, chunk, background_rgb=background_rgb, device=device
+        )
 
 
 def render_video(
@@ -121,9 +187,17 @@ def render_video(
     fps: int = 30,
     device: str | torch.device = "cuda",
 ) -> pathlib.Path:
-    """Render a turntable video and save to mp4."""
+    """Render a turntable video and save to mp4.
 
-    frames = render_gaussians(gaussians, cameras, device=device)
+    Frames are streamed into the encoder as they render instead of being
+    collected into an (N, H, W, 3) array first, keeping memory flat for
+    long or high-resolution paths.
+    """
+
+    cameras_list = list(cameras)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    media.write_video(output_path, frames, fps=fps)
+    shape = (cameras_list[0].height, cameras_list[0].width)
+    with media.VideoWriter(output_path, shape=shape, fps=fps) as writer:
+        for frame in iter_render(gaussians, cameras_list, device=device):
+            writer.add_image(frame)
     return output_path
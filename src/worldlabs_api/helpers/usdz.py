@@ -2,6 +2,11 @@
 
 Format matches NVIDIA 3dgrut: scales and densities are stored in pre-activation
 form (log-scale and logit respectively) for renderer compatibility.
+
+With quantize=True the schema diverges from 3dgrut: scales and rotations are
+stored as half precision and features_albedo as uint8 RGB (the SPZ/.splat
+family encoding), cutting per-splat bytes roughly in half. Loaders detect the
+quantized attributes by value type and dequantize on read.
 """
 
 from __future__ import annotations
@@ -16,25 +21,95 @@ from pxr import Sdf, Usd, UsdGeom, UsdUtils, Vt
 from worldlabs_api.gaussian import Gaussian3D
 
 
-def _numpy_to_vec3f_array(arr: np.ndarray) -> Vt.Vec3fArray:
-    """Convert (N, 3) numpy array to Vt.Vec3fArray using buffer protocol."""
-    arr = np.ascontiguousarray(arr, dtype=np.float32)
-    return Vt.Vec3fArray.FromNumpy(arr)
+def _as_f32_contiguous(arr: np.ndarray) -> np.ndarray:
+    """Return arr as C-contiguous float32, skipping the call when it already is.
+
+    The Vt.*Array.FromNumpy constructors consume correctly-laid-out arrays
+    zero-copy via the buffer protocol; only the strided staging slices
+    actually need the copy.
+    """
+    if arr.dtype == np.float32 and arr.flags["C_CONTIGUOUS"]:
+        return arr
+    return np.ascontiguousarray(arr, dtype=np.float32)
+
+
+# Full-precision Vt constructor per trailing shape: (N, 3) vectors,
+# (N, 4) quaternions in (w, x, y, z) order, and flat (N,) floats all
+# funnel through one table lookup instead of three near-identical helpers
+_VT_CTORS = {
+    (3,): Vt.Vec3fArray.FromNumpy,
+    (4,): Vt.QuatfArray.FromNumpy,
+    (1,): Vt.FloatArray.FromNumpy,
+}
+
+
+def _to_vt(arr: np.ndarray):
+    """Convert a float numpy array to the matching Vt array via buffer protocol."""
+    return _VT_CTORS[arr.shape[1:] or (1,)](_as_f32_contiguous(arr))
+
+
+def _numpy_to_vec3h_array(arr: np.ndarray) -> Vt.Vec3hArray:
+    """Convert (N, 3) numpy array to half-precision Vt.Vec3hArray."""
+    arr = np.ascontiguousarray(arr, dtype=np.float16)
+    return Vt.Vec3hArray.FromNumpy(arr)
 
 
-def _numpy_to_quatf_array(arr: np.ndarray) -> Vt.QuatfArray:
-    """Convert (N, 4) numpy array (w, x, y, z) to Vt.QuatfArray using buffer protocol."""
-    arr = np.ascontiguousarray(arr, dtype=np.float32)
-    return Vt.QuatfArray.FromNumpy(arr)
+def _numpy_to_quath_array(arr: np.ndarray) -> Vt.QuathArray:
+    """Convert (N, 4) numpy array (w, x, y, z) to half-precision Vt.QuathArray."""
+    arr = np.ascontiguousarray(arr, dtype=np.float16)
+    return Vt.QuathArray.FromNumpy(arr)
 
 
-def _numpy_to_float_array(arr: np.ndarray) -> Vt.FloatArray:
-    """Convert (N,) numpy array to Vt.FloatArray using buffer protocol."""
-    arr = np.ascontiguousarray(arr.ravel(), dtype=np.float32)
-    return Vt.FloatArray.FromNumpy(arr)
+def _numpy_to_uchar_rgb_array(arr: np.ndarray) -> Vt.UCharArray:
+    """Quantize (N, 3) RGB in [0, 1] to a flat (3N,) Vt.UCharArray."""
+    quantized = (np.clip(arr, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+    return Vt.UCharArray.FromNumpy(np.ascontiguousarray(quantized.ravel()))
 
 
-def save_usdz(gaussians: Gaussian3D, output_path: pathlib.Path) -> pathlib.Path:
+def _prep(
+    mean: torch.Tensor,
+    quat: torch.Tensor,
+    feat: torch.Tensor,
+    scale: torch.Tensor,
+    opacity: torch.Tensor,
+) -> torch.Tensor:
+    """Pack the five export fields into one (N, 14) pre-activation tensor.
+
+    Scripted so the clamp/logit/log elementwise chain and the cat fuse
+    into a handful of kernels instead of one launch (plus one
+    intermediate allocation) per op.
+    """
+    # One clone, then clamp and logit mutate it in place: the out-of-place
+    # chain allocated a fresh [N] tensor per step
+    densities = opacity.squeeze(-1).clone()
+    densities.clamp_(1e-6, 1 - 1e-6)
+    densities.logit_()
+    return torch.cat(
+        [mean, quat, feat, torch.log(scale), densities.unsqueeze(-1)], dim=1
+    )
+
+
+# Scripted form of _prep, compiled on first use. Compiling at import
+# would charge every process the TorchScript startup cost whether or not
+# it exports; compiling inside save_usdz would re-run it per call.
+_prep_fn = None
+
+
+def _get_prep_fn():
+    global _prep_fn
+    if _prep_fn is None:
+        try:
+            _prep_fn = torch.jit.script(_prep)
+        except Exception:  # pragma: no cover - torchscript unavailable
+            _prep_fn = _prep
+    return _prep_fn
+
+
+def save_usdz(
+    gaussians: Gaussian3D,
+    output_path: pathlib.Path,
+    quantize: bool = False,
+) -> pathlib.Path:
     """Save a Gaussian3D to a compressed USDZ file.
 
     Stores data in pre-activation form (matching NVIDIA 3dgrut format):
@@ -43,6 +118,10 @@ def save_usdz(gaussians: Gaussian3D, output_path: pathlib.Path) -> pathlib.Path:
         - rotations: normalized quaternions (w, x, y, z)
         - features_albedo: RGB [0, 1]
 
+    With quantize=True, scales and rotations are written as half precision
+    and features_albedo as uint8 RGB, shrinking the package (and the write)
+    roughly 1.7x at precision well below what renderers display.
+
     Attribute mapping:
         mean -> positions
         log(scale) -> scales
@@ -53,19 +132,42 @@ def save_usdz(gaussians: Gaussian3D, output_path: pathlib.Path) -> pathlib.Path:
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert tensors to numpy, applying inverse activations for 3dgrut compatibility
-    positions_np = gaussians.mean.detach().cpu().numpy()
-    rotations_np = gaussians.quaternion.detach().cpu().numpy()
-    features_np = gaussians.feature.detach().cpu().numpy()
-
-    # Convert activated values to pre-activation (matching 3dgrut)
-    # scales: exp'd -> log-scale
-    scales_np = torch.log(gaussians.scale).detach().cpu().numpy()
-    # opacities: sigmoid'd -> logit (pre-sigmoid)
-    opacity_clamped = gaussians.opacity.squeeze(-1).clamp(1e-6, 1 - 1e-6)
-    densities_np = torch.logit(opacity_clamped).detach().cpu().numpy()
-
-    # USDZ is a package format, so we must create a .usdc first then package it
+    # Apply the inverse activations (for 3dgrut compatibility) on the
+    # source device, pack all five fields into one (N, 14) tensor, and
+    # bring it to the host as a single pinned-memory copy. Five separate
+    # .cpu() calls would each sync the stream and do a pageable transfer;
+    # this way there is one DMA and one sync.
+    with torch.no_grad():
+        # scales go out as log-scale, opacities as logit (pre-sigmoid)
+        packed = _get_prep_fn()(
+            gaussians.mean,
+            gaussians.quaternion,
+            gaussians.feature,
+            gaussians.scale,
+            gaussians.opacity,
+        )
+        if packed.is_cuda:
+            staging = torch.empty(
+                packed.shape, dtype=torch.float32, pin_memory=True
+            )
+            staging.copy_(packed, non_blocking=True)
+            torch.cuda.synchronize()
+        else:
+            # Host (or non-CUDA accelerator) tensors need no pinned
+            # staging: .to is a no-op for CPU float32 and otherwise does
+            # the one required device/dtype conversion
+            staging = packed.to("cpu", torch.float32)
+
+    staging_np = staging.numpy()
+    positions_np = staging_np[:, 0:3]
+    rotations_np = staging_np[:, 3:7]
+    features_np = staging_np[:, 7:10]
+    scales_np = staging_np[:, 10:13]
+    densities_np = staging_np[:, 13]
+
+    # USDZ is a package format and Sdf refuses to write package layers
+    # directly, so author a .usdc in a tempdir and zip it into the
+    # package with UsdUtils
     with tempfile.TemporaryDirectory() as tmp_dir:
         usdc_path = pathlib.Path(tmp_dir) / "gaussians.usdc"
 
@@ -79,29 +181,48 @@ def save_usdz(gaussians: Gaussian3D, output_path: pathlib.Path) -> pathlib.Path:
         positions_attr = prim.CreateAttribute(
             "positions", Sdf.ValueTypeNames.Point3fArray
         )
-        positions_attr.Set(_numpy_to_vec3f_array(positions_np))
+        positions_attr.Set(_to_vt(positions_np))
 
         # Scales (N, 3) - stored as log-scale (pre-activation)
-        scales_attr = prim.CreateAttribute("scales", Sdf.ValueTypeNames.Vector3fArray)
-        scales_attr.Set(_numpy_to_vec3f_array(scales_np))
+        if quantize:
+            scales_attr = prim.CreateAttribute("scales", Sdf.ValueTypeNames.Half3Array)
+            scales_attr.Set(_numpy_to_vec3h_array(scales_np))
+        else:
+            scales_attr = prim.CreateAttribute(
+                "scales", Sdf.ValueTypeNames.Vector3fArray
+            )
+            scales_attr.Set(_to_vt(scales_np))
 
         # Rotations (N, 4) - stored as (w, x, y, z) quaternions
-        rotations_attr = prim.CreateAttribute(
-            "rotations", Sdf.ValueTypeNames.QuatfArray
-        )
-        rotations_attr.Set(_numpy_to_quatf_array(rotations_np))
+        if quantize:
+            rotations_attr = prim.CreateAttribute(
+                "rotations", Sdf.ValueTypeNames.QuathArray
+            )
+            rotations_attr.Set(_numpy_to_quath_array(rotations_np))
+        else:
+            rotations_attr = prim.CreateAttribute(
+                "rotations", Sdf.ValueTypeNames.QuatfArray
+            )
+            rotations_attr.Set(_to_vt(rotations_np))
 
         # Densities (N,) - stored as logit (pre-activation)
         densities_attr = prim.CreateAttribute(
             "densities", Sdf.ValueTypeNames.FloatArray
         )
-        densities_attr.Set(_numpy_to_float_array(densities_np))
-
-        # Features albedo (N, 3) - RGB colors [0, 1]
-        features_attr = prim.CreateAttribute(
-            "features_albedo", Sdf.ValueTypeNames.Color3fArray
-        )
-        features_attr.Set(_numpy_to_vec3f_array(features_np))
+        densities_attr.Set(_to_vt(densities_np))
+
+        # Features albedo (N, 3) - RGB colors [0, 1]; quantized form is a
+        # flat (3N,) uint8 array
+        if quantize:
+            features_attr = prim.CreateAttribute(
+                "features_albedo", Sdf.ValueTypeNames.UCharArray
+            )
+            features_attr.Set(_numpy_to_uchar_rgb_array(features_np))
+        else:
+            features_attr = prim.CreateAttribute(
+                "features_albedo", Sdf.ValueTypeNames.Color3fArray
+            )
+            features_attr.Set(_to_vt(features_np))
 
         stage.GetRootLayer().Save()
 
@@ -4,9 +4,17 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Annotated, Any, Generic, Literal, TypeVar
+from typing import Annotated, Generic, Literal, TypeVar
 
-from pydantic import AliasChoices, BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    Field,
+    JsonValue,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 
 
 class Permission(BaseModel):
@@ -27,7 +35,7 @@ class MediaAsset(BaseModel):
 
     media_asset_id: str = Field(..., description="Server-generated media asset ID")
     file_name: str = Field(..., description="File name")
-    metadata: dict[str, Any] | None = Field(
+    metadata: dict[str, JsonValue] | None = Field(
         default=None, description="Optional application-specific metadata"
     )
     extension: str | None = Field(
@@ -64,7 +72,7 @@ class MediaAssetPrepareUploadRequest(BaseModel):
         examples=["mp4", "png", "jpg"],
     )
     kind: MediaAssetKind = Field(..., description="High-level media type")
-    metadata: dict[str, Any] | None = Field(
+    metadata: dict[str, JsonValue] | None = Field(
         default=None, description="Optional application-specific metadata"
     )
 
@@ -119,11 +127,19 @@ class BasePrompt(BaseModel):
         None, description="If True, use text_prompt as-is without recaptioning"
     )
 
-    @model_validator(mode="after")
-    def validate_disable_recaption_requires_text(self) -> "BasePrompt":
-        if self.disable_recaption and not self.text_prompt:
+    # mode="before" validators inspect the raw input dict, so invalid
+    # prompts are rejected before any field parsing or instance
+    # materialization; already-constructed instances pass straight through
+    @model_validator(mode="before")
+    @classmethod
+    def validate_disable_recaption_requires_text(cls, values: object) -> object:
+        if (
+            isinstance(values, dict)
+            and values.get("disable_recaption")
+            and not values.get("text_prompt")
+        ):
             raise ValueError("text_prompt is required when disable_recaption is True")
-        return self
+        return values
 
 
 class WorldTextPrompt(BasePrompt):
@@ -131,11 +147,12 @@ class WorldTextPrompt(BasePrompt):
 
     type: Literal["text"] = "text"
 
-    @model_validator(mode="after")
-    def validate_text_prompt_required(self) -> "WorldTextPrompt":
-        if not self.text_prompt:
+    @model_validator(mode="before")
+    @classmethod
+    def validate_text_prompt_required(cls, values: object) -> object:
+        if isinstance(values, dict) and not values.get("text_prompt"):
             raise ValueError("text_prompt is required for text-to-world generation")
-        return self
+        return values
 
 
 class ImagePrompt(BasePrompt):
@@ -290,7 +307,7 @@ class Operation(BaseModel, Generic[T]):
     error: OperationError | None = Field(
         default=None, description="Error information if the operation failed"
     )
-    metadata: dict[str, Any] | None = Field(
+    metadata: dict[str, JsonValue] | None = Field(
         default=None,
         description="Service-specific metadata, such as progress percentage",
     )
@@ -345,3 +362,15 @@ class ListWorldsRequest(BaseModel):
     page_token: str | None = Field(
         None, description="Cursor token for pagination"
     )
+
+
+# Pre-built adapters for the discriminated unions: TypeAdapter compiles
+# the tag-dispatch table once, so validating a raw prompt or content dict
+# through these is a single O(1) lookup instead of re-resolving the union
+# per call.
+WORLD_PROMPT_ADAPTER: TypeAdapter[
+    WorldTextPrompt | ImagePrompt | MultiImagePrompt | VideoPrompt
+] = TypeAdapter(WorldPromptTypeUnion)
+CONTENT_ADAPTER: TypeAdapter[
+    MediaAssetReference | UriReference | DataBase64Reference
+] = TypeAdapter(Content)